@@ -11,7 +11,7 @@ service to the database layer) without exposing internal domain models.
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .enums import SortKey
 
@@ -30,16 +30,17 @@ class TrackUpdateDTO:
         return {k: v for k, v in asdict(self).items() if v is not None}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackQueryDTO:
     """
     DTO for specifying complex filters and sorting options when querying tracks.
     An empty instance with default values will fetch all tracks sorted by plays.
+    Slotted because the UI rebuilds one per keystroke and sort change.
     """
     search_text: Optional[str] = None
     artist_filter: Optional[str] = None
     status_filter: Optional[str] = None  # Changed from TrackStatus to string to avoid circular import
-    tags_filter: Optional[List[str]] = None
+    tags_filter: Optional[Tuple[str, ...]] = None  # Lists are accepted and stored as tuples
     is_favorite: Optional[bool] = None
     min_duration: Optional[float] = None
     max_duration: Optional[float] = None
@@ -51,6 +52,11 @@ class TrackQueryDTO:
     limit: Optional[int] = None
     offset: Optional[int] = None
     
+    def __post_init__(self):
+        # Keep every field hashable so queries can be used as cache keys.
+        if isinstance(self.tags_filter, list):
+            object.__setattr__(self, 'tags_filter', tuple(self.tags_filter))
+    
     def is_empty(self) -> bool:
         """Checks if the query has any specific filters applied."""
         # Note: sort_by and sort_descending are not considered filters.
@@ -248,6 +248,24 @@ class TrackListItem(VirtualListItem):
         except Exception as e:
             logger.error(f"❌ Error updating widget for {self.track.title}: {e}")
 
+    def update_selection(self, widget: ttk.Frame, is_selected: bool) -> None:
+        """
+        Restyles the item for a selection change without touching its content.
+        """
+        if self._is_destroyed or self.widgets.frame is not widget:
+            self.update_widget(widget, is_selected)
+            return
+
+        hovered = self._state in (TrackItemState.HOVERED, TrackItemState.SELECTED_HOVERED)
+        if is_selected:
+            new_state = TrackItemState.SELECTED_HOVERED if hovered else TrackItemState.SELECTED
+        else:
+            new_state = TrackItemState.HOVERED if hovered else TrackItemState.NORMAL
+
+        if new_state != self._state:
+            self._state = new_state
+            self._update_styles()
+
     def _update_content(self):
         """Updates all widget content with track data."""
         if not self.widgets.frame:
@@ -18,9 +18,26 @@ class VirtualListItem(ABC):
 
     @abstractmethod
     def update_widget(self, widget: tk.Widget, is_selected: bool) -> None:
-        """Update the widget's content and state (e.g., selection)."""
+        """
+        Update the widget's content and state (e.g., selection).
+
+        Called for every visible row on each scroll, so implementations should
+        gather all option changes for a widget into one dict and apply them with
+        a single ``widget.configure(**attrs)`` rather than one ``config`` call
+        per option; each call is a Tcl round-trip.
+        """
         raise NotImplementedError
 
+    def update_selection(self, widget: tk.Widget, is_selected: bool) -> None:
+        """
+        Update only the selection-related appearance of the widget.
+
+        Selection clicks and arrow-key navigation go through this narrow path.
+        Subclasses should override it to restyle without rebuilding content;
+        the default falls back to a full ``update_widget``.
+        """
+        self.update_widget(widget, is_selected)
+
     @abstractmethod
     def get_height(self) -> int:
         """Return the item's height in pixels."""
@@ -20,6 +20,9 @@ logger = get_logger(__name__)
 class VirtualList(ttk.Frame):
     """COMPATIBLE PRO VERSION: High-performance virtual list with existing WidgetManager API."""
     
+    # Render requests arriving within one frame (~60 Hz) are coalesced into one.
+    RENDER_COALESCE_MS = 16
+    
     def __init__(
         self,
         parent: tk.Widget,
@@ -46,7 +49,6 @@ class VirtualList(ttk.Frame):
         # Rendering state
         self._render_job: Optional[str] = None
         self._render_generator: Optional[Generator] = None
-        self._last_render_time: float = 0
         self._render_stats: Dict[str, Any] = {
             'total_renders': 0,
             'average_render_time': 0,
@@ -189,18 +191,23 @@ class VirtualList(ttk.Frame):
         return start_idx, end_idx
 
     def _schedule_render(self, event=None):
-        """Schedule render with performance throttling."""
+        """
+        Schedule a render, coalescing requests to at most one per frame.
+
+        A request made while a render is already scheduled folds into it: the
+        render reads the scroll position and ``selected_index`` when it runs,
+        so nothing is dropped and the selection is never stale.
+        """
         if self._is_shutting_down: 
             return
             
-        # Throttle rapid render requests
-        current_time = time.time()
-        if current_time - self._last_render_time < 0.001:  # 1ms throttle
+        # A job without a generator is a render still waiting to run; a job
+        # with one is only stepping a render that has already drawn.
+        if self._render_job and self._render_generator is None:
             return
             
-        self._last_render_time = current_time
         self._cancel_render_job()
-        self._render_job = self.after(1, self._run_render_generator)
+        self._render_job = self.after(self.RENDER_COALESCE_MS, self._run_render_generator)
 
     def _run_render_generator(self):
         """Run render generator."""
@@ -7,9 +7,9 @@ displayed in the VirtualList, ensuring high performance with large datasets.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Optional, Any, Deque
+from typing import Dict, List, Optional, Any
+import time
 import weakref
-from collections import deque
 
 from .base import VirtualListItem
 from ....utils.logging import get_logger
@@ -22,11 +22,19 @@ class WidgetManager:
     Manages a pool of recycled widgets to display virtual list items efficiently.
     """
     
+    # Pooled widgets idle for longer than this are destroyed, so a long-lived
+    # window keeps only its working set alive rather than its high-water mark.
+    POOL_IDLE_TTL = 30.0
+    POOL_GC_INTERVAL_MS = 5000
+    
     def __init__(self, virtual_list, item_height: int, max_pool_size: int = 50):
         self.virtual_list_ref = weakref.ref(virtual_list)
         self.item_height = item_height
         
-        self.widget_pool: Deque[tk.Widget] = deque(maxlen=max_pool_size)
+        # LIFO stack: the most recently pooled widget is reused first, as it is
+        # the one most likely to still be warm in Python's and Tk's caches.
+        self.max_pool_size = max_pool_size
+        self.widget_pool: List[tk.Widget] = []
         self.visible_widgets: Dict[int, tk.Widget] = {}
         self._widget_to_index: Dict[int, int] = {}
         
@@ -34,6 +42,8 @@ class WidgetManager:
         self.inner_frame: Optional[ttk.Frame] = None
         self._is_shutting_down: bool = False
         
+        self._pool_gc_job: Optional[str] = None
+        
         logger.debug(f"🚀 WidgetManager initialized (max_pool_size={max_pool_size})")
 
     @property
@@ -53,25 +63,45 @@ class WidgetManager:
         self.inner_frame = frame
         logger.debug("✅ Inner frame set for WidgetManager")
 
+    @staticmethod
+    def _track_destroy(widget: tk.Widget) -> None:
+        """
+        Marks the widget with ``_destroyed`` once Tk destroys it.
+
+        Lets the pool and render paths check liveness with an attribute read
+        instead of a ``winfo_exists()`` Tcl round-trip on every access.
+        """
+        widget._destroyed = False
+
+        def on_destroy(event: tk.Event, w=widget):
+            if event.widget is w:
+                w._destroyed = True
+
+        widget.bind('<Destroy>', on_destroy, add='+')
+
+    @staticmethod
+    def _is_destroyed(widget: tk.Widget) -> bool:
+        """Returns True if the widget is known to have been destroyed."""
+        return getattr(widget, '_destroyed', False)
+
     def get_or_create_widget(self, item: VirtualListItem) -> Optional[tk.Widget]:
         """Retrieves a recycled widget from the pool or creates a new one."""
         if self._is_shutting_down: return None
         
         # Try to get from pool
         while self.widget_pool:
-            widget = self.widget_pool.popleft()
-            try:
-                if widget.winfo_exists():
-                    logger.debug("🔥 Widget retrieved from pool.")
-                    return widget
-            except tk.TclError:
-                continue
+            widget = self.widget_pool.pop()
+            if not self._is_destroyed(widget):
+                logger.debug("🔥 Widget retrieved from pool.")
+                return widget
         
         # Create new widget - MUST be parented to inner_frame, not canvas
         try:
             if self.inner_frame and self.inner_frame.winfo_exists():
                 # logger.debug("🆕 New widget created.")
-                return item.create_widget(self.inner_frame)
+                widget = item.create_widget(self.inner_frame)
+                self._track_destroy(widget)
+                return widget
         except Exception as e:
             logger.error(f"❌ Failed to create widget: {e}")
         return None
@@ -82,18 +112,22 @@ class WidgetManager:
             return
         
         try:
-            if not widget.winfo_exists():
+            if self._is_destroyed(widget):
                 return
                 
             widget.place_forget()
+            widget._placed_y = None
+            widget._placed_w = None
             
             # Call cleanup hook if available
             if item and hasattr(item, 'destroy_widget'):
                 item.destroy_widget(widget)
             
             # Return to pool or destroy if pool is full
-            if len(self.widget_pool) < self.widget_pool.maxlen:
+            if len(self.widget_pool) < self.max_pool_size:
+                widget._pooled_at = time.monotonic()
                 self.widget_pool.append(widget)
+                self._schedule_pool_gc()
                 # logger.debug("♻️ Widget returned to pool")
             else:
                 widget.destroy()
@@ -101,22 +135,66 @@ class WidgetManager:
         except Exception as e:
             logger.debug(f"Error returning widget to pool: {e}")
 
+    def _schedule_pool_gc(self):
+        """Arms the periodic idle-widget eviction if it is not already pending."""
+        if self._pool_gc_job is not None or not self.inner_frame:
+            return
+        try:
+            self._pool_gc_job = self.inner_frame.after(self.POOL_GC_INTERVAL_MS, self._gc_pool)
+        except tk.TclError:
+            self._pool_gc_job = None
+
+    def _cancel_pool_gc(self):
+        """Cancels the pending idle-widget eviction, if any."""
+        if self._pool_gc_job is not None and self.inner_frame:
+            try:
+                self.inner_frame.after_cancel(self._pool_gc_job)
+            except tk.TclError:
+                pass
+        self._pool_gc_job = None
+
+    def _gc_pool(self):
+        """Destroys pooled widgets that have been idle longer than POOL_IDLE_TTL."""
+        self._pool_gc_job = None
+        if self._is_shutting_down:
+            return
+        
+        # The pool is a stack, so the oldest entries sit at the bottom.
+        cutoff = time.monotonic() - self.POOL_IDLE_TTL
+        pool = self.widget_pool
+        expired = 0
+        while expired < len(pool) and getattr(pool[expired], '_pooled_at', 0.0) < cutoff:
+            expired += 1
+        
+        for widget in pool[:expired]:
+            try:
+                widget.destroy()
+            except tk.TclError:
+                pass
+        del pool[:expired]
+        
+        if expired:
+            logger.debug(f"🗑️ Evicted {expired} idle pooled widgets")
+        if pool:
+            self._schedule_pool_gc()
+
     def clear_all_widgets(self):
         """Hides all visible widgets and completely clears the pool."""
         logger.debug("🧹 Clearing all widgets...")
         
         # Hide and pool all visible widgets
+        vl = self.virtual_list
+        items = vl.items if vl else []
+        n = len(items)
         for index, widget in list(self.visible_widgets.items()):
-            item = None
-            if self.virtual_list and index < len(self.virtual_list.items):
-                item = self.virtual_list.items[index]
-            self.return_widget_to_pool(widget, item)
+            self.return_widget_to_pool(widget, items[index] if index < n else None)
         
         self.visible_widgets.clear()
         self._widget_to_index.clear()
+        self._cancel_pool_gc()
         
         # Destroy all pooled widgets
-        for widget in list(self.widget_pool):
+        for widget in self.widget_pool:
             try:
                 if widget.winfo_exists(): 
                     widget.destroy()
@@ -126,14 +204,33 @@ class WidgetManager:
         
         logger.debug("✅ All widgets cleared.")
 
-    def render_item_at_index(self, item: VirtualListItem, index: int, is_selected: bool):
-        """Creates or updates and positions a single widget at a given index."""
+    def _get_canvas_width(self) -> int:
+        """Returns the current canvas width, falling back to a sensible default."""
+        return self.canvas.winfo_width() if self.canvas and self.canvas.winfo_exists() else 400
+
+    def render_item_at_index(
+        self,
+        item: VirtualListItem,
+        index: int,
+        is_selected: bool,
+        y_position: Optional[int] = None,
+        canvas_width: Optional[int] = None,
+        place_batch: Optional[List[tuple]] = None
+    ):
+        """
+        Creates or updates and positions a single widget at a given index.
+
+        The render loop passes ``y_position`` and ``canvas_width`` precomputed so
+        they are not re-derived (and the canvas re-queried) for every row. When
+        ``place_batch`` is given, placement is queued there instead of issued
+        immediately; see ``_place_batch``.
+        """
         if self._is_shutting_down or not self.inner_frame:
             return
 
         # Get or create widget
         widget = self.visible_widgets.get(index)
-        if not widget or not widget.winfo_exists():
+        if not widget or self._is_destroyed(widget):
             widget = self.get_or_create_widget(item)
             if not widget: 
                 return
@@ -143,14 +240,27 @@ class WidgetManager:
         # Update widget content and appearance
         try:
             item.update_widget(widget, is_selected)
+            widget._selected = is_selected
         except Exception as e:
             logger.error(f"❌ Error updating widget for index {index}: {e}")
             return
 
         # CRITICAL: Position widget at absolute coordinates within inner_frame
         # The inner_frame itself is inside the canvas and will scroll with it
-        y_position = index * self.item_height
-        canvas_width = self.canvas.winfo_width() if self.canvas and self.canvas.winfo_exists() else 400
+        if y_position is None:
+            y_position = index * self.item_height
+        if canvas_width is None:
+            canvas_width = self._get_canvas_width()
+        
+        # The y-position relative to inner_frame is fixed per index, so only
+        # widgets that are freshly placed or have been resized need place().
+        if (getattr(widget, '_placed_y', None) == y_position
+                and getattr(widget, '_placed_w', None) == canvas_width):
+            return
+        
+        if place_batch is not None:
+            place_batch.append((widget, y_position, canvas_width))
+            return
         
         try:
             widget.place(
@@ -160,12 +270,46 @@ class WidgetManager:
                 height=self.item_height,
                 anchor='nw'
             )
+            widget._placed_y = y_position
+            widget._placed_w = canvas_width
             # logger.debug(f"📍 Widget {index} placed at y={y_position}")
         except Exception as e:
             logger.error(f"❌ Error placing widget at index {index}: {e}")
 
-    def hide_and_pool_item(self, index: int):
-        """Removes a widget from view and returns it to the pool."""
+    def _place_batch(self, batch: List[tuple]):
+        """
+        Positions queued widgets with a single Tcl round-trip.
+
+        ``batch`` holds ``(widget, y_position, width)`` tuples. All ``place``
+        commands are joined into one script and evaluated at once instead of
+        crossing the Python/Tcl boundary once per row.
+        """
+        if not batch or not self.inner_frame:
+            return
+        
+        height = self.item_height
+        script = "\n".join(
+            f"place {widget._w} -x 0 -y {y} -width {width} -height {height} -anchor nw"
+            for widget, y, width in batch
+        )
+        try:
+            self.inner_frame.tk.eval(script)
+        except tk.TclError as e:
+            # Rows left without a cached position are simply placed next frame.
+            logger.error(f"❌ Error placing widget batch: {e}")
+            return
+        
+        for widget, y, width in batch:
+            widget._placed_y = y
+            widget._placed_w = width
+
+    def hide_and_pool_item(self, index: int, item: Optional[VirtualListItem] = None):
+        """
+        Removes a widget from view and returns it to the pool.
+
+        Callers that already hold the item should pass it to avoid resolving it
+        again through the VirtualList weak reference.
+        """
         if index not in self.visible_widgets:
             return
             
@@ -175,15 +319,22 @@ class WidgetManager:
         if widget_id in self._widget_to_index:
             del self._widget_to_index[widget_id]
         
-        item = None
-        if self.virtual_list and index < len(self.virtual_list.items):
-            item = self.virtual_list.items[index]
+        if item is None:
+            vl = self.virtual_list
+            if vl and index < len(vl.items):
+                item = vl.items[index]
         
         self.return_widget_to_pool(widget, item)
         logger.debug(f"👻 Widget {index} hidden and pooled")
             
     def update_visible_widgets(self, items: List[VirtualListItem], start_idx: int, end_idx: int, selected_index: Optional[int]):
-        """The main rendering loop called by VirtualList."""
+        """
+        The main rendering loop called by VirtualList.
+
+        Renders immediately. Bursts of requests are coalesced upstream by
+        ``VirtualList._schedule_render`` (one render per frame), which reads
+        the selection when the render runs, so the one passed in is current.
+        """
         if self._is_shutting_down:
             return
         
@@ -193,15 +344,21 @@ class WidgetManager:
         visible_indices = set(range(start_idx, end_idx))
         current_indices = set(self.visible_widgets.keys())
 
+        n = len(items)
+
         # Remove widgets that are no longer visible
         to_remove = current_indices - visible_indices
         for idx in to_remove:
-            self.hide_and_pool_item(idx)
+            self.hide_and_pool_item(idx, items[idx] if idx < n else None)
         
-        # Render visible widgets
-        for idx in visible_indices:
-            if idx < len(items):
-                self.render_item_at_index(items[idx], idx, idx == selected_index)
+        # Render visible widgets; loop invariants are bound once per frame
+        item_height = self.item_height
+        canvas_width = self._get_canvas_width()
+        render = self.render_item_at_index
+        place_batch: List[tuple] = []
+        for idx in range(start_idx, min(end_idx, n)):
+            render(items[idx], idx, idx == selected_index, idx * item_height, canvas_width, place_batch)
+        self._place_batch(place_batch)
         
         logger.debug(f"✅ Render complete: {len(visible_indices)} widgets visible, {len(to_remove)} removed")
 
@@ -211,14 +368,19 @@ class WidgetManager:
             return
             
         widget = self.visible_widgets.get(index)
-        if not widget or not widget.winfo_exists():
+        if not widget or self._is_destroyed(widget):
+            return
+        
+        if getattr(widget, '_selected', None) is is_selected:
             return
             
-        if not self.virtual_list or index >= len(self.virtual_list.items):
+        vl = self.virtual_list
+        if not vl or index >= len(vl.items):
             return
             
         try:
-            self.virtual_list.items[index].update_widget(widget, is_selected)
+            vl.items[index].update_selection(widget, is_selected)
+            widget._selected = is_selected
             logger.debug(f"🔄 Widget {index} selection updated: {is_selected}")
         except Exception as e:
             logger.error(f"❌ Error updating widget selection for index {index}: {e}")
@@ -1,20 +1,17 @@
-# udio_media_manager/ui/event_handlers.py - ULTIMATE DEBUGGED VERSION
+# udio_media_manager/ui/event_handlers.py
 
 """
-ULTIMATE Event Handling with COMPREHENSIVE CLICK DEBUGGING
-
-This FINAL VERSION features:
-- ✅ COMPLETE CLICK EVENT TRACING - Every selection event is logged
-- ✅ CALLBACK CHAIN VERIFICATION - Validates callback integrity
-- ✅ DOUBLE-CLICK MYSTERY SOLVED - Identifies where double-click is handled
-- ✅ SINGLE-CLICK FIX - Ensures single clicks are properly processed
-- ✅ ROBUST ERROR HANDLING - All operations have proper error handling
+Application Event Handling
+
+Binds global shortcuts and routes UI callbacks (selection, playback, search,
+scanning, theming) to the main window and controllers. Handlers stay lean
+because they run on every click and keypress.
 """
 
 import tkinter as tk
 from tkinter import filedialog
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Dict, Callable, Any
+from typing import TYPE_CHECKING, Optional, Dict, Callable
 import weakref
 
 # Use TYPE_CHECKING for type hints, breaking circular import dependencies at runtime.
@@ -31,25 +28,24 @@ logger = get_logger(__name__)
 
 
 class EventHandlers:
-    """DEBUGGED VERSION: Manages event bindings with comprehensive click debugging."""
+    """Manages global event bindings and UI callback dispatch."""
 
     def __init__(self, main_window: "MainWindow"):
         """Initializes the EventHandlers with a weak reference to the main window."""
         self.main_window_ref = weakref.ref(main_window)
         self.root = main_window.root
         
-        # Track callback counts for debugging
-        self.callback_counts = {
-            'track_select': 0,
-            'track_double_click': 0,
-            'play_track': 0
-        }
-        
         # Dependencies are injected via setup_managers to break circular dependencies.
         self.audio_controller: Optional["AudioController"] = None
         self.scan_manager: Optional["ScanManager"] = None
+        
+        # Last raw volume value; Tk scales repeat the same value while dragging
+        # against an endpoint, so identical consecutive values are skipped.
+        # Seek is not de-duplicated: playback moves on between calls, so the
+        # same value can be a real request to jump back.
+        self._last_volume_value: Optional[str] = None
 
-        logger.debug("🎯 EventHandlers initialized with click debugging")
+        logger.debug("🎯 EventHandlers initialized")
 
     @property
     def main_window(self) -> Optional["MainWindow"]:
@@ -68,26 +64,13 @@ class EventHandlers:
             logger.warning("Cannot set up bindings: root window is not available.")
             return
             
-        # DEBUG: Log all global bindings
-        logger.debug("🎯 Setting up global event bindings...")
-        
         self.root.bind('<Control-f>', self._on_focus_search)
         self.root.bind('<F5>', self._on_refresh)
         self.root.bind('<Control-q>', self._on_quit)
         self.root.bind('<space>', self._on_toggle_playback)
         
-        # DEBUG: Add test binding to see if double-click is handled globally
-        self.root.bind('<Double-Button-1>', self._test_global_double_click, add='+')
-        
         logger.debug("✅ Global event bindings configured.")
 
-    def _test_global_double_click(self, event: tk.Event) -> None:
-        """DEBUG: Test if double-click events reach the root window"""
-        logger.debug(f"🎵 GLOBAL DOUBLE-CLICK DETECTED!")
-        logger.debug(f"🎵   Widget: {event.widget}")
-        logger.debug(f"🎵   Coordinates: ({event.x}, {event.y})")
-        logger.debug(f"🎵   Root widget: {self.root}")
-
     def register_system_callbacks(self) -> None:
         """Registers this handler to receive callbacks from other application systems."""
         if self.main_window and self.main_window.theme:
@@ -96,8 +79,8 @@ class EventHandlers:
             self.scan_manager.register_callback('scan_complete', self._on_scan_complete)
 
     def get_ui_callbacks(self) -> Dict[str, Callable]:
-        """DEBUGGED VERSION: Returns all handler methods with callback verification."""
-        callbacks = {
+        """Returns the handler methods keyed by the callback names MainWindow expects."""
+        return {
             'on_browse': self._on_browse, 
             'on_scan': self._on_scan, 
             'on_cancel_scan': self._on_cancel_scan,
@@ -105,7 +88,7 @@ class EventHandlers:
             'on_search': self._on_search, 
             'on_search_clear': self._on_search_clear,
             'on_track_select': self._on_track_select, 
-            'on_track_double_click': self._on_play_track,  # NOTE: This maps to _on_play_track!
+            'on_track_double_click': self._on_play_track,
             'on_track_sort': self._on_track_sort, 
             'on_play_pause': self._on_toggle_playback,
             'on_stop': self._on_stop_audio, 
@@ -115,21 +98,12 @@ class EventHandlers:
             'on_volume_change': self._on_volume_change, 
             'on_toggle_theme': self._on_toggle_theme,
         }
-        
-        # DEBUG: Log callback mapping
-        logger.debug("🎯 EventHandlers callback mapping:")
-        for name, callback in callbacks.items():
-            logger.debug(f"🎯   {name}: {callback.__name__}")
-            
-        # CRITICAL DISCOVERY: on_track_double_click maps to _on_play_track!
-        logger.debug("🚨 DISCOVERY: on_track_double_click → _on_play_track")
-        
-        return callbacks
 
     # --- System & Hotkey Handlers ---
     
     def _on_scan_complete(self, result: "ScanResult"):
         if self.main_window: 
+            self.main_window.invalidate_track_cache()
             self.main_window.refresh_tracks()
 
     def _on_theme_changed(self, new_theme_mode: "ThemeMode"):
@@ -141,6 +115,7 @@ class EventHandlers:
 
     def _on_refresh(self, event: Optional[tk.Event] = None):
         if self.main_window: 
+            self.main_window.invalidate_track_cache()
             self.main_window.refresh_tracks()
 
     def _on_quit(self, event: Optional[tk.Event] = None):
@@ -182,12 +157,7 @@ class EventHandlers:
                 main_win.theme.toggle_theme()
 
     def _on_track_select(self, track: "Track"):
-        """DEBUGGED VERSION: Track selection handler with comprehensive logging."""
-        self.callback_counts['track_select'] += 1
-        logger.debug(f"🎯 EVENTHANDLERS._on_track_select CALLED #{self.callback_counts['track_select']}")
-        logger.debug(f"🎯   Track: '{track.title if track else 'None'}'")
-        logger.debug(f"🎯   Callback count: {self.callback_counts}")
-        
+        """Shows the selected track in the main window."""
         if not track:
             logger.error("❌ EVENTHANDLERS: Received None track!")
             return
@@ -197,10 +167,9 @@ class EventHandlers:
             logger.error("❌ EVENTHANDLERS: MainWindow reference is None!")
             return
             
-        logger.debug(f"✅ EVENTHANDLERS: Calling main_window.set_current_track()")
+        logger.debug("🎯 Track selected: %s", track.title)
         try:
             main_win.set_current_track(track)
-            logger.debug("✅ EVENTHANDLERS: set_current_track completed successfully")
         except Exception as e:
             logger.error(f"❌ EVENTHANDLERS: Error in set_current_track: {e}", exc_info=True)
 
@@ -209,24 +178,15 @@ class EventHandlers:
             main_win.sort_tracks(sort_key, descending)
 
     def _on_play_track(self, track: "Track"):
-        """DEBUGGED VERSION: Play track handler - THIS IS CALLED FOR DOUBLE-CLICK!"""
-        self.callback_counts['play_track'] += 1
-        self.callback_counts['track_double_click'] += 1
-        
-        logger.debug(f"🎵 EVENTHANDLERS._on_play_track CALLED #{self.callback_counts['play_track']}")
-        logger.debug(f"🎵   Track: '{track.title if track else 'None'}'")
-        logger.debug(f"🎵   Callback counts: {self.callback_counts}")
-        logger.debug("🚨 DISCOVERY: This is the double-click handler!")
-        
+        """Plays a track; wired to the track list's double-click callback."""
         if not track:
             logger.error("❌ EVENTHANDLERS: Received None track for playback!")
             return
             
         if self.audio_controller:
-            logger.debug(f"✅ EVENTHANDLERS: Calling audio_controller.play_track()")
+            logger.debug("🎵 Play requested: %s", track.title)
             try:
                 self.audio_controller.play_track(track)
-                logger.debug("✅ EVENTHANDLERS: play_track completed successfully")
             except Exception as e:
                 logger.error(f"❌ EVENTHANDLERS: Error in play_track: {e}", exc_info=True)
         else:
@@ -245,47 +205,24 @@ class EventHandlers:
             self.audio_controller.play_previous()
 
     def _on_seek(self, value_str: str):
-        if self.audio_controller:
-            try: 
-                self.audio_controller.seek_by_percentage(float(value_str))
-            except (ValueError, TypeError): 
-                pass
+        if not self.audio_controller:
+            return
+        try: 
+            self.audio_controller.seek_by_percentage(float(value_str))
+        except (ValueError, TypeError): 
+            pass
 
     def _on_volume_change(self, value_str: str):
-        if self.audio_controller:
-            try: 
-                self.audio_controller.set_volume(int(float(value_str)))
-            except (ValueError, TypeError): 
-                pass
-
-    def verify_callback_chain(self) -> Dict[str, Any]:
-        """NEW: Verifies the integrity of the callback chain."""
-        status = {
-            'main_window_available': self.main_window is not None,
-            'audio_controller_available': self.audio_controller is not None,
-            'scan_manager_available': self.scan_manager is not None,
-            'callback_counts': self.callback_counts.copy(),
-            'root_window_available': self.root is not None
-        }
-        
-        logger.debug(f"🔍 EventHandlers callback chain status: {status}")
-        return status
-
-    def test_track_selection(self, track: "Track") -> bool:
-        """NEW: Manually test track selection for debugging."""
-        logger.info("🧪 MANUALLY TESTING TRACK SELECTION...")
-        try:
-            self._on_track_select(track)
-            logger.info("✅ Manual track selection test completed")
-            return True
-        except Exception as e:
-            logger.error(f"❌ Manual track selection test failed: {e}")
-            return False
+        if not self.audio_controller or value_str == self._last_volume_value:
+            return
+        self._last_volume_value = value_str
+        try: 
+            self.audio_controller.set_volume(int(float(value_str)))
+        except (ValueError, TypeError): 
+            pass
 
     def shutdown(self):
-        """DEBUGGED VERSION: Cleanup with callback statistics."""
-        logger.debug(f"🛑 EventHandlers shutdown - Callback statistics: {self.callback_counts}")
-        
+        """Unregisters system listeners."""
         if (main_win := self.main_window) and main_win.theme:
             main_win.theme.unregister_theme_listener(self._on_theme_changed)
             
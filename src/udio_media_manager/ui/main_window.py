@@ -9,7 +9,10 @@ as the central orchestrator for data state, filtering, and the crucial
 shutdown sequence.
 """
 
+import functools
+import logging
 import tkinter as tk
+from dataclasses import replace
 from tkinter import ttk
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable, List, TYPE_CHECKING
@@ -33,12 +36,39 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Integer ordinal per sort key; cheaper to compare and hash than Enum members.
+_SORT_ORDINALS: Dict[SortKey, int] = {key: i for i, key in enumerate(SortKey)}
+
+
+def _mk_button(parent: tk.Widget, text: str, command: Optional[Callable], style: Optional[str] = None) -> ttk.Button:
+    """Creates a ttk.Button, passing a style only when one is given."""
+    if style:
+        return ttk.Button(parent, text=text, command=command, style=style)
+    return ttk.Button(parent, text=text, command=command)
+
+
 class MainWindow:
     """
     A factory and registry for all UI widgets and application state.
     Manages building the UI, handling data state (query/sort), and lifecycle.
     """
     
+    # Display strings for the status variables.
+    NO_TRACK = "No track selected."
+    TRACK_COUNT_FMT = "{:,} Tracks".format
+    
+    # Fixed attribute set; '__weakref__' because controllers hold weak refs to us.
+    __slots__ = (
+        'root', 'service', 'audio_player', 'image_loader', 'theme',
+        'current_track', '_is_built', '_is_shutting_down', 'current_query', '_sort_ord',
+        '_cached_get_tracks',
+        'dir_var', 'track_count_var', 'now_playing_track_var',
+        'header_frame', 'main_paned_window', 'audio_controls_frame', 'status_bar',
+        'track_list', 'metadata_view', 'search_entry',
+        'dir_frame', 'action_frame', 'transport_frame',
+        '__weakref__',
+    )
+    
     def __init__(self, root: tk.Tk, service: "UdioService", audio_player: "AudioPlayer", image_loader: "ImageLoader", theme_manager: "ThemeManager"):
         self.root = root
         self.service = service
@@ -51,11 +81,16 @@ class MainWindow:
         self._is_built = False
         self._is_shutting_down = False
         self.current_query = TrackQueryDTO(sort_by=SortKey.DATE, sort_descending=True)
+        self._sort_ord = _SORT_ORDINALS[SortKey.DATE]
+        
+        # Recent query results, so filter-clear-refilter cycles skip the database.
+        # Cleared by invalidate_track_cache() whenever the library may have changed.
+        self._cached_get_tracks = functools.lru_cache(maxsize=16)(self._fetch_tracks)
 
         # --- Control Variables ---
         self.dir_var = tk.StringVar(value=str(Path.home() / "Music"))
-        self.track_count_var = tk.StringVar(value="0 Tracks")
-        self.now_playing_track_var = tk.StringVar(value="No track selected.")
+        self.track_count_var = tk.StringVar(value=self.TRACK_COUNT_FMT(0))
+        self.now_playing_track_var = tk.StringVar(value=self.NO_TRACK)
 
         # --- Component References ---
         self.header_frame: Optional[ttk.Frame] = None
@@ -80,9 +115,10 @@ class MainWindow:
         logger.info("🎯 Building all UI component instances with callback debugging...")
         
         # DEBUG: Log all available callbacks
-        logger.debug("🎯 AVAILABLE CALLBACKS:")
-        for callback_name, callback_func in callbacks.items():
-            logger.debug(f"🎯   {callback_name}: {callback_func}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 AVAILABLE CALLBACKS:")
+            for callback_name, callback_func in callbacks.items():
+                logger.debug(f"🎯   {callback_name}: {callback_func}")
         
         # CRITICAL: Check if selection callbacks exist
         on_track_select = callbacks.get('on_track_select')
@@ -121,13 +157,13 @@ class MainWindow:
         self.dir_frame = ttk.Frame(self.header_frame)
         ttk.Label(self.dir_frame, text="Music Directory:").pack(side=tk.LEFT, padx=(0, 5))
         ttk.Entry(self.dir_frame, textvariable=self.dir_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(self.dir_frame, text="Browse...", command=callbacks.get('on_browse')).pack(side=tk.LEFT, padx=(5, 0))
+        _mk_button(self.dir_frame, "Browse...", callbacks.get('on_browse')).pack(side=tk.LEFT, padx=(5, 0))
         
         self.action_frame = ttk.Frame(self.header_frame)
         self.search_entry = SearchEntry(self.action_frame, on_search=callbacks.get('on_search'), on_clear=callbacks.get('on_search_clear'))
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(self.action_frame, text="Scan", command=callbacks.get('on_scan'), style='Primary.TButton').pack(side=tk.LEFT, padx=(10, 0))
-        ttk.Button(self.action_frame, text="Refresh", command=callbacks.get('on_refresh')).pack(side=tk.LEFT, padx=5)
+        _mk_button(self.action_frame, "Scan", callbacks.get('on_scan'), 'Primary.TButton').pack(side=tk.LEFT, padx=(10, 0))
+        _mk_button(self.action_frame, "Refresh", callbacks.get('on_refresh')).pack(side=tk.LEFT, padx=5)
 
         left_pane = ttk.Frame(self.main_paned_window)
         
@@ -149,19 +185,29 @@ class MainWindow:
         self.main_paned_window.add(right_pane, weight=2)
 
         self.transport_frame = ttk.Frame(self.audio_controls_frame)
-        ttk.Button(self.transport_frame, text="⏮", command=callbacks.get('on_previous')).pack(side=tk.LEFT)
-        ttk.Button(self.transport_frame, text="▶", command=callbacks.get('on_play_pause'), style='Primary.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(self.transport_frame, text="⏹", command=callbacks.get('on_stop')).pack(side=tk.LEFT)
-        ttk.Button(self.transport_frame, text="⏭", command=callbacks.get('on_next')).pack(side=tk.LEFT, padx=5)
+        _mk_button(self.transport_frame, "⏮", callbacks.get('on_previous')).pack(side=tk.LEFT)
+        _mk_button(self.transport_frame, "▶", callbacks.get('on_play_pause'), 'Primary.TButton').pack(side=tk.LEFT, padx=5)
+        _mk_button(self.transport_frame, "⏹", callbacks.get('on_stop')).pack(side=tk.LEFT)
+        _mk_button(self.transport_frame, "⏭", callbacks.get('on_next')).pack(side=tk.LEFT, padx=5)
 
     def _layout_components(self) -> None:
-        """Places all created components onto the main window."""
-        self.header_frame.pack(fill='x', padx=10, pady=(10, 5))
-        self.main_paned_window.pack(fill='both', expand=True, padx=10)
-        self.audio_controls_frame.pack(fill='x', padx=10, pady=5)
-        self.status_bar.pack(fill='x', side='bottom')
-        self.dir_frame.pack(fill=tk.X, pady=(0, 10))
-        self.action_frame.pack(fill=tk.X)
+        """
+        Places all created components onto the main window.
+
+        Tk defers geometry computation to idle time, so all packs below are
+        resolved in a single layout pass once the event loop runs; no explicit
+        ``update_idletasks`` is needed (or wanted) here.
+        """
+        layout = (
+            (self.header_frame, {'fill': 'x', 'padx': 10, 'pady': (10, 5)}),
+            (self.main_paned_window, {'fill': 'both', 'expand': True, 'padx': 10}),
+            (self.audio_controls_frame, {'fill': 'x', 'padx': 10, 'pady': 5}),
+            (self.status_bar, {'fill': 'x', 'side': 'bottom'}),
+            (self.dir_frame, {'fill': tk.X, 'pady': (0, 10)}),
+            (self.action_frame, {'fill': tk.X}),
+        )
+        for widget, options in layout:
+            widget.pack_configure(**options)
         
         # CRITICAL: Make sure TrackList is properly packed
         if self.track_list:
@@ -181,18 +227,22 @@ class MainWindow:
 
     def _test_callback_chain(self) -> None:
         """Test the complete callback chain for debugging"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         logger.info("🧪 TESTING CALLBACK CHAIN...")
         
         # Test 1: Check if TrackList received callbacks
         if self.track_list:
-            logger.info(f"🧪 TrackList.on_select: {getattr(self.track_list, 'on_select', 'MISSING')}")
-            logger.info(f"🧪 TrackList.on_double_click: {getattr(self.track_list, 'on_double_click', 'MISSING')}")
+            tl = self.track_list
+            logger.info("🧪 TrackList.on_select: %s", getattr(tl, 'on_select', None) or 'MISSING')
+            logger.info("🧪 TrackList.on_double_click: %s", getattr(tl, 'on_double_click', None) or 'MISSING')
         else:
             logger.error("❌ TrackList is None!")
             
         # Test 2: Check if we have tracks to test with
-        if hasattr(self, 'current_track') and self.current_track:
-            logger.info(f"🧪 Current track available: {self.current_track.title}")
+        if self.current_track:
+            logger.info("🧪 Current track available: %s", self.current_track.title)
         else:
             logger.warning("⚠️ No current track available for testing")
             
@@ -200,8 +250,7 @@ class MainWindow:
 
     def set_current_track(self, track: Optional["Track"]) -> None:
         """DEBUG VERSION - Set current track with extensive logging"""
-        logger.debug(f"🎯 MAINWINDOW.set_current_track CALLED")
-        logger.debug(f"🎯 Track received: '{track.title if track else 'None'}'")
+        logger.debug("🎯 MAINWINDOW.set_current_track: %r", track.title if track else None)
         
         if not self._is_built: 
             logger.warning("🚫 MAINWINDOW: UI not built yet, ignoring track selection")
@@ -222,19 +271,17 @@ class MainWindow:
             logger.error("❌ MAINWINDOW: No metadata_view reference!")
         
         # Update now playing display
-        if track:
-            display_text = f"{track.title} by {track.artist}"
+        display_text = f"{track.title} by {track.artist}" if track else self.NO_TRACK
+        # Skip the write (and its trace callbacks / label relayout) when unchanged.
+        if self.now_playing_track_var.get() != display_text:
             self.now_playing_track_var.set(display_text)
-            logger.debug(f"✅ MAINWINDOW: Now playing updated: {display_text}")
-        else:
-            self.now_playing_track_var.set("No track selected.")
-            logger.debug("✅ MAINWINDOW: Now playing cleared")
+            logger.debug("✅ MAINWINDOW: Now playing updated: %s", display_text)
             
         logger.debug("✅ MAINWINDOW.set_current_track COMPLETED")
     
     def update_track_list(self, tracks: List["Track"], total_count: int) -> None:
         """Update track list with debug logging"""
-        logger.debug(f"🎯 MAINWINDOW.update_track_list called with {len(tracks)} tracks")
+        logger.debug("🎯 MAINWINDOW.update_track_list called with %d tracks", len(tracks))
         
         if not self._is_built: 
             logger.warning("🚫 MAINWINDOW: UI not built, ignoring track list update")
@@ -247,8 +294,10 @@ class MainWindow:
         else:
             logger.error("❌ MAINWINDOW: No track_list reference!")
             
-        self.track_count_var.set(f"{total_count:,} Tracks")
-        logger.debug(f"✅ MAINWINDOW: Track count updated to {total_count:,}")
+        count_text = self.TRACK_COUNT_FMT(total_count)
+        if self.track_count_var.get() != count_text:
+            self.track_count_var.set(count_text)
+        logger.debug("✅ MAINWINDOW: Track count updated to %d", total_count)
 
     def refresh_tracks(self) -> None:
         """Refresh tracks with query debugging"""
@@ -258,36 +307,43 @@ class MainWindow:
             
         logger.info(f"🎯 Refreshing track list with query: {self.current_query}")
         try:
-            tracks, total_count = self.service.get_tracks(self.current_query)
+            cached_tracks, total_count = self._cached_get_tracks(self.current_query)
+            tracks = list(cached_tracks)
             logger.debug(f"🎯 Service returned {len(tracks)} tracks, total: {total_count}")
             self.update_track_list(tracks, total_count)
             logger.info(f"✅ Track list updated with {total_count:,} tracks.")
         except Exception as e:
             logger.error(f"❌ Error refreshing tracks: {e}", exc_info=True)
 
+    def _fetch_tracks(self, query: TrackQueryDTO):
+        """Queries the service; wrapped per instance by ``_cached_get_tracks``."""
+        tracks, total_count = self.service.get_tracks(query)
+        # Stored as a tuple so consumers cannot mutate the cached result.
+        return tuple(tracks), total_count
+
+    def invalidate_track_cache(self) -> None:
+        """Drops memoized query results, e.g. after a scan has changed the library."""
+        self._cached_get_tracks.cache_clear()
+
     def filter_tracks(self, search_text: str) -> None:
         """Filter tracks with search term logging"""
-        logger.debug(f"🎯 MAINWINDOW.filter_tracks called with: '{search_text}'")
-        self.current_query = TrackQueryDTO(
-            search_text=search_text if search_text else None,
-            sort_by=self.current_query.sort_by,
-            sort_descending=self.current_query.sort_descending
-        )
+        logger.debug("🎯 MAINWINDOW.filter_tracks called with: %r", search_text)
+        self.current_query = replace(self.current_query, search_text=search_text or None)
         self.refresh_tracks()
 
     def sort_tracks(self, sort_key: SortKey, descending: bool) -> None:
         """Sort tracks with sorting debug"""
-        logger.debug(f"🎯 MAINWINDOW.sort_tracks called: {sort_key}, descending: {descending}")
-        self.current_query = TrackQueryDTO(
-            search_text=self.current_query.search_text,
-            sort_by=sort_key,
-            sort_descending=descending
-        )
+        logger.debug("🎯 MAINWINDOW.sort_tracks called: %s, descending: %s", sort_key, descending)
+        sort_ord = _SORT_ORDINALS[sort_key]
+        if sort_ord == self._sort_ord and descending == self.current_query.sort_descending:
+            return
+        self._sort_ord = sort_ord
+        self.current_query = replace(self.current_query, sort_by=sort_key, sort_descending=descending)
         self.refresh_tracks()
     
     def show_notification(self, message: str, level: str = "info") -> None:
         """Show notification with level logging"""
-        logger.debug(f"🎯 MAINWINDOW.show_notification: [{level}] {message}")
+        logger.debug("🎯 MAINWINDOW.show_notification: [%s] %s", level, message)
         if self.status_bar: 
             self.status_bar.set_message(message, level)
     
@@ -299,18 +355,21 @@ class MainWindow:
         self._is_shutting_down = True
         logger.info("🛑 Shutting down MainWindow and all child components...")
         
-        # Shutdown in reverse dependency order
-        if self.track_list: 
-            self.track_list.shutdown()
-            logger.debug("✅ TrackList shutdown")
-            
-        if self.image_loader: 
-            self.image_loader.shutdown()
-            logger.debug("✅ ImageLoader shutdown")
-            
-        if self.audio_player: 
-            self.audio_player.shutdown()
-            logger.debug("✅ AudioPlayer shutdown")
+        # Shutdown in reverse dependency order. These stay on the main thread:
+        # each one touches Tk (widget teardown, PhotoImage release, state callbacks).
+        for name, component in (
+            ("TrackList", self.track_list),
+            ("ImageLoader", self.image_loader),
+            ("AudioPlayer", self.audio_player),
+        ):
+            if not component:
+                continue
+            try:
+                component.shutdown()
+                logger.debug("✅ %s shutdown", name)
+            except Exception as e:
+                # Keep going so one failing subsystem can't leave the others running.
+                logger.error(f"❌ Error shutting down {name}: {e}", exc_info=True)
             
         logger.info("✅ MainWindow shutdown complete.")
 
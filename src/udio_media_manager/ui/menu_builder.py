@@ -3,85 +3,101 @@ Menu construction and management - EXTRACTED from main_window.py
 """
 
 import tkinter as tk
+from tkinter import messagebox
 from typing import Any
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Label used in the item tables below to request a menu separator.
+_SEPARATOR = "__sep__"
+
+
 class MenuBuilder:
     """Builds and manages application menus."""
     
+    # (label, accelerator, handler method name) per menu entry
+    _FILE_ITEMS = (
+        ("Scan Directory…", "Ctrl+S", "_on_scan_directory"),
+        (_SEPARATOR, None, None),
+        ("Preferences…", "Ctrl+,", "_on_preferences"),
+        (_SEPARATOR, None, None),
+        ("Exit", "Ctrl+Q", "_on_exit"),
+    )
+    _EXPORT_ITEMS = (
+        ("Export CSV…", None, "_on_export_csv"),
+        ("Export JSON…", None, "_on_export_json"),
+    )
+    _HELP_ITEMS = (
+        ("Documentation", None, "_on_documentation"),
+        (_SEPARATOR, None, None),
+        ("About", None, "_on_about"),
+    )
+    
     def __init__(self, root: tk.Tk, main_window: Any):
         self.root = root
         self.main_window = main_window
         self.menubar: Optional[tk.Menu] = None
+        
+        self.file_menu: Optional[tk.Menu] = None
+        self.export_menu: Optional[tk.Menu] = None
+        self.help_menu: Optional[tk.Menu] = None
+        self._file_menu_built = False
+        self._export_menu_built = False
+        self._help_menu_built = False
 
     def build_menu_bar(self) -> None:
-        """Build the complete menu bar."""
-        self.menubar = tk.Menu(self.root, tearoff=0)
-        
-        self._build_file_menu()
-        self._build_export_menu()
-        self._build_help_menu()
-        
-        self.root.configure(menu=self.menubar)
+        """
+        Build the menu bar.
 
-    def _build_file_menu(self) -> None:
-        """Build File menu."""
-        file_menu = tk.Menu(self.menubar, tearoff=0)
-        
-        file_menu.add_command(
-            label="Scan Directory…", 
-            accelerator="Ctrl+S", 
-            command=self._on_scan_directory
-        )
-        file_menu.add_separator()
-        file_menu.add_command(
-            label="Preferences…", 
-            accelerator="Ctrl+,", 
-            command=self._on_preferences
-        )
-        file_menu.add_separator()
-        file_menu.add_command(
-            label="Exit", 
-            accelerator="Ctrl+Q", 
-            command=self._on_exit
-        )
+        Only the cascade stubs are created here; each submenu is populated by
+        its ``postcommand`` the first time it is opened, which keeps the
+        ``add_command`` Tcl calls off the startup path.
+        """
+        self.menubar = tk.Menu(self.root, tearoff=0)
         
-        self.menubar.add_cascade(label="File", menu=file_menu)
-
-    def _build_export_menu(self) -> None:
-        """Build Export menu."""
-        export_menu = tk.Menu(self.menubar, tearoff=0)
+        self.file_menu = tk.Menu(self.menubar, tearoff=0, postcommand=self._populate_file_menu)
+        self.export_menu = tk.Menu(self.menubar, tearoff=0, postcommand=self._populate_export_menu)
+        self.help_menu = tk.Menu(self.menubar, tearoff=0, postcommand=self._populate_help_menu)
         
-        export_menu.add_command(
-            label="Export CSV…", 
-            command=self._on_export_csv
-        )
-        export_menu.add_command(
-            label="Export JSON…", 
-            command=self._on_export_json
-        )
+        self.menubar.add_cascade(label="File", menu=self.file_menu)
+        self.menubar.add_cascade(label="Export", menu=self.export_menu)
+        self.menubar.add_cascade(label="Help", menu=self.help_menu)
         
-        self.menubar.add_cascade(label="Export", menu=export_menu)
+        self.root.configure(menu=self.menubar)
 
-    def _build_help_menu(self) -> None:
-        """Build Help menu."""
-        help_menu = tk.Menu(self.menubar, tearoff=0)
-        
-        help_menu.add_command(
-            label="Documentation", 
-            command=self._on_documentation
-        )
-        help_menu.add_separator()
-        help_menu.add_command(
-            label="About", 
-            command=self._on_about
-        )
-        
-        self.menubar.add_cascade(label="Help", menu=help_menu)
+    def _populate_menu(self, menu: tk.Menu, items: Tuple[Tuple[str, Optional[str], Optional[str]], ...]) -> None:
+        """Adds the entries described by an item table to a menu."""
+        for label, accelerator, handler in items:
+            if label == _SEPARATOR:
+                menu.add_separator()
+            elif accelerator:
+                menu.add_command(label=label, accelerator=accelerator, command=getattr(self, handler))
+            else:
+                menu.add_command(label=label, command=getattr(self, handler))
+
+    def _populate_file_menu(self) -> None:
+        """Populate File menu on first open."""
+        if self._file_menu_built:
+            return
+        self._file_menu_built = True
+        self._populate_menu(self.file_menu, self._FILE_ITEMS)
+
+    def _populate_export_menu(self) -> None:
+        """Populate Export menu on first open."""
+        if self._export_menu_built:
+            return
+        self._export_menu_built = True
+        self._populate_menu(self.export_menu, self._EXPORT_ITEMS)
+
+    def _populate_help_menu(self) -> None:
+        """Populate Help menu on first open."""
+        if self._help_menu_built:
+            return
+        self._help_menu_built = True
+        self._populate_menu(self.help_menu, self._HELP_ITEMS)
 
     # Menu action handlers
     def _on_scan_directory(self) -> None:
@@ -92,7 +108,6 @@ class MenuBuilder:
 
     def _on_preferences(self) -> None:
         """Handle Preferences menu action."""
-        import tkinter.messagebox as messagebox
         messagebox.showinfo("Preferences", "Preferences dialog coming soon!")
 
     def _on_exit(self) -> None:
@@ -101,22 +116,18 @@ class MenuBuilder:
 
     def _on_export_csv(self) -> None:
         """Handle Export CSV menu action."""
-        import tkinter.messagebox as messagebox
         messagebox.showinfo("Export", "CSV export coming soon!")
 
     def _on_export_json(self) -> None:
         """Handle Export JSON menu action."""
-        import tkinter.messagebox as messagebox
         messagebox.showinfo("Export", "JSON export coming soon!")
 
     def _on_documentation(self) -> None:
         """Handle Documentation menu action."""
-        import tkinter.messagebox as messagebox
         messagebox.showinfo("Help", "Documentation coming soon!")
 
     def _on_about(self) -> None:
         """Handle About menu action."""
-        import tkinter.messagebox as messagebox
         messagebox.showinfo("About", "Udio Media Manager\nComplete Metadata Edition")
 
     def shutdown(self) -> None:
@@ -10,11 +10,12 @@ scan lifecycle (start, progress, cancellation, completion, error) and communicat
 state changes back to the application via a decoupled callback system.
 """
 
+import time
 from pathlib import Path
 from typing import Optional, Callable, Any, TYPE_CHECKING, Dict, List
 import weakref
 from enum import Enum, auto
-from collections import defaultdict
+from collections import deque
 
 # Use TYPE_CHECKING to import types for static analysis, breaking circular imports.
 if TYPE_CHECKING:
@@ -41,12 +42,45 @@ class ScanState(Enum):
 class ScanManager:
     """Manages directory scanning operations and reports state via callbacks."""
     
+    # Minimum seconds between progress broadcasts (~30 Hz is plenty for a progress bar).
+    PROGRESS_INTERVAL = 0.033
+    
+    __slots__ = (
+        'service', 'main_window_ref', '_root_after', '_state',
+        '_progress_cbs', '_state_cbs', '_complete_cbs', '_error_cbs', '_callback_lists',
+        '_pending', '_flush_scheduled', '_last_progress_ts', '_pending_progress',
+    )
+    
     def __init__(self, udio_service: "UdioService", main_window: "MainWindow"):
         self.service = udio_service
         self.main_window_ref = weakref.ref(main_window)
         
+        # Bound once so dispatch doesn't walk weakref -> window -> root per event.
+        root = getattr(main_window, 'root', None)
+        self._root_after: Optional[Callable] = root.after if root else None
+        
         self._state: ScanState = ScanState.IDLE
-        self._callbacks: Dict[str, List[Callable]] = defaultdict(list)
+        
+        # One listener list per event, so hot dispatch (progress) is a plain
+        # attribute load rather than a dict lookup by event name.
+        self._progress_cbs: List[Callable] = []
+        self._state_cbs: List[Callable] = []
+        self._complete_cbs: List[Callable] = []
+        self._error_cbs: List[Callable] = []
+        self._callback_lists: Dict[str, List[Callable]] = {
+            'scan_progress': self._progress_cbs,
+            'scan_state_changed': self._state_cbs,
+            'scan_complete': self._complete_cbs,
+            'scan_error': self._error_cbs,
+        }
+        
+        # Callbacks queued from the service thread, drained in one UI tick.
+        self._pending: deque = deque()
+        self._flush_scheduled = False
+        
+        # Progress throttling: only the latest DTO per interval is delivered.
+        self._last_progress_ts = 0.0
+        self._pending_progress: Optional["ScanProgressDTO"] = None
 
     @property
     def main_window(self) -> Optional["MainWindow"]:
@@ -57,19 +91,54 @@ class ScanManager:
 
     def register_callback(self, event_type: str, callback: Callable):
         """Allows other components to listen for scan events."""
-        self._callbacks.setdefault(event_type, []).append(callback)
+        callbacks = self._callback_lists.get(event_type)
+        if callbacks is None:
+            logger.warning(f"Ignoring callback for unknown scan event: {event_type}")
+            return
+        callbacks.append(callback)
+
+    def _trigger_callbacks(self, callbacks: List[Callable], *args, **kwargs):
+        """
+        Queues the given listeners for a scan event to run on the main UI thread.
 
-    def _trigger_callbacks(self, event_type: str, *args, **kwargs):
-        """Triggers all registered callbacks for a given scan event on the main UI thread."""
-        if not (main_win := self.main_window) or not main_win.root:
+        Rather than one ``root.after`` per listener per event, callbacks are
+        appended to a queue and a single tick is scheduled to drain it, so a
+        burst of progress events costs one Tk timer instead of hundreds.
+        """
+        if not callbacks or self._root_after is None:
             return
         
-        for callback in self._callbacks.get(event_type, []):
+        for callback in callbacks:
+            self._pending.append((callback, args, kwargs))
+        
+        if self._flush_scheduled:
+            return
+        
+        # Liveness is only checked when a new tick is needed, not per event.
+        if self.main_window_ref() is None:
+            self._root_after = None
+            self._pending.clear()
+            return
+        
+        self._flush_scheduled = True
+        try:
+            # Use root.after to ensure UI updates happen safely on the main thread.
+            self._root_after(0, self._flush_pending)
+        except Exception as e:
+            self._flush_scheduled = False
+            logger.error(f"Error scheduling scan callbacks: {e}", exc_info=True)
+
+    def _flush_pending(self) -> None:
+        """Runs every queued callback in order; called on the main UI thread."""
+        # Clear the flag first so events queued while draining schedule a new tick.
+        self._flush_scheduled = False
+        pending = self._pending
+        while pending:
+            callback, args, kwargs = pending.popleft()
             try:
-                # Use root.after to ensure UI updates happen safely on the main thread.
-                main_win.root.after(0, lambda c=callback, a=args, kw=kwargs: c(*a, **kw))
+                callback(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error scheduling callback for {event_type}: {e}", exc_info=True)
+                logger.error(f"Error in scan callback {callback}: {e}", exc_info=True)
 
     def _set_state(self, new_state: ScanState):
         """Atomically sets the manager's state and notifies listeners."""
@@ -78,7 +147,7 @@ class ScanManager:
         
         logger.info(f"ScanManager state changing from {self._state.name} to {new_state.name}")
         self._state = new_state
-        self._trigger_callbacks('scan_state_changed', new_state)
+        self._trigger_callbacks(self._state_cbs, new_state)
 
     def start_scan(self, directory: str, force_rescan: bool = False) -> None:
         """Starts the directory scanning process if the manager is idle."""
@@ -97,6 +166,8 @@ class ScanManager:
             
         logger.info(f"Starting scan of directory: {dir_path}")
         self._set_state(ScanState.SCANNING)
+        self._last_progress_ts = 0.0
+        self._pending_progress = None
         scan_request = ScanRequestDTO(scan_path=dir_path, force_rescan=force_rescan)
         
         # Delegate the heavy lifting to the service layer.
@@ -117,14 +188,34 @@ class ScanManager:
         self.service.cancel_scan()
 
     def _on_scan_progress(self, progress: "ScanProgressDTO") -> None:
-        """Handles scan progress updates from the service thread."""
-        if self._state in [ScanState.SCANNING, ScanState.CANCELLING]:
-            self._trigger_callbacks('scan_progress', progress)
+        """
+        Handles scan progress updates from the service thread.
+
+        Updates arrive at I/O rate; only the newest one is broadcast, at most
+        once per ``PROGRESS_INTERVAL``. Completion flushes whatever is left.
+        """
+        if self._state not in (ScanState.SCANNING, ScanState.CANCELLING):
+            return
+        
+        self._pending_progress = progress
+        now = time.monotonic()
+        if now - self._last_progress_ts >= self.PROGRESS_INTERVAL:
+            self._last_progress_ts = now
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        """Broadcasts the pending progress update, if any."""
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self._trigger_callbacks(self._progress_cbs, progress)
 
     def _on_scan_complete(self, result: "ScanResult") -> None:
         """Handles scan completion from the service thread."""
         logger.info(f"Scan completed with status from service: {result.status.name}")
         
+        # Deliver the last throttled progress update before the completion events.
+        self._flush_progress()
+        
         # Use the ScanStatus enum for comparison
         if result.status == ScanStatus.ERROR:
             self._set_state(ScanState.ERROR)
@@ -133,13 +224,13 @@ class ScanManager:
             # should return the manager to an IDLE state.
             self._set_state(ScanState.IDLE)
         
-        self._trigger_callbacks('scan_complete', result)
+        self._trigger_callbacks(self._complete_cbs, result)
 
     def _handle_scan_error(self, error_message: str) -> None:
         """Handles an unexpected error during scan setup."""
         logger.error(f"Scan setup error: {error_message}")
         self._set_state(ScanState.ERROR)
-        self._trigger_callbacks('scan_error', error_message)
+        self._trigger_callbacks(self._error_cbs, error_message)
 
     def shutdown(self) -> None:
         """Shuts down the scan manager, cancelling any ongoing scan."""
@@ -7,8 +7,10 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Any, Optional, Callable, Set, Tuple, List
 from dataclasses import dataclass, fields
+import inspect
 import re
 import time
+import weakref
 
 from ...core.singleton import SingletonBase
 from ...core.constants import FONTS
@@ -17,6 +19,9 @@ from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Theme variable reference, e.g. 'primary_bg' or 'primary_accent@-0.2'.
+_VAR_RE = re.compile(r"(\w+)(@([+-]?\d*\.?\d+))?$")
+
 @dataclass
 class ColorScheme:
     """Complete color scheme definition with semantic naming."""
@@ -49,6 +54,15 @@ class ColorScheme:
     scrollbar_thumb: str
     scrollbar_thumb_hover: str
 
+# Computed once; dataclasses.fields() builds a new tuple on every call.
+_COLOR_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(ColorScheme))
+
+def _adjust_rgb(r: int, g: int, b: int, factor: float) -> int:
+    """Lightens (factor > 0) or darkens (factor < 0) an RGB triple; returns packed 0xRRGGBB."""
+    if factor > 0: r, g, b = int(r+(255-r)*factor), int(g+(255-g)*factor), int(b+(255-b)*factor)
+    else: r, g, b = int(r*(1+factor)), int(g*(1+factor)), int(b*(1+factor))
+    return (max(0,min(255,r)) << 16) | (max(0,min(255,g)) << 8) | max(0,min(255,b))
+
 @dataclass
 class ThemeConfig:
     """Complete theme configuration, including fonts."""
@@ -69,12 +83,23 @@ class AdvancedThemeManager(SingletonBase):
         self._style: Optional[ttk.Style] = None
         self._user_theme_choice: ThemeMode = ThemeMode.SYSTEM
         self._resolved_theme: ThemeMode = ThemeMode.DARK # Default fallback
-        self._theme_listeners: Set[Callable[[ThemeMode], None]] = set()
-        self._color_cache: Dict[str, str] = {}
+        # Bound methods are held as WeakMethods (see _listener_entry) so widgets can be collected.
+        self._theme_listeners: Set[Any] = set()
+        self._color_cache: Dict[Tuple[str, float], str] = {}
+        self._colors_dict_cache: Dict[ThemeMode, Dict[str, str]] = {}
+        # Lookup tables for the active theme (each mode in turn while
+        # _resolve_all_styles runs); see _load_lookup_tables.
+        self._colors_dict: Dict[str, str] = {}
+        self._spacing: Dict[str, int] = {}
+        self._fonts: Dict[str, Tuple[str, int, str]] = {}
         self._is_initialized = False
+        self._apply_pending = False
         self._color_schemes = self._create_color_schemes()
         self._theme_configs = self._create_theme_configs()
         self._style_definitions = self._get_style_definitions()
+        self._resolved_root_styles: Dict[ThemeMode, Dict[str, Any]] = {}
+        self._resolved_styles: Dict[ThemeMode, Dict[str, Dict[str, Any]]] = {}
+        self._resolve_all_styles()
         logger.info("🚀 Professional ThemeManager initialized")
 
     def initialize(self, root: tk.Tk) -> None:
@@ -140,8 +165,9 @@ class AdvancedThemeManager(SingletonBase):
         return {
             # --- BASE ELEMENT STYLES ---
             'Tk.Root': {'background': 'primary_bg'},
-            'TFrame': {'configure': {'background': 'primary_bg'}},
-            'TLabel': {'configure': {'background': 'primary_bg', 'foreground': 'primary_text', 'font': 'main'}},
+            # Root style: ttk propagates these to every style that doesn't override them
+            # (TFrame, TLabel, ...), so they aren't repeated per style.
+            '.': {'configure': {'background': 'primary_bg', 'foreground': 'primary_text', 'font': 'main'}},
             'TButton': {'configure': {'padding': ('lg', 'md'), 'font': 'button', 'borderwidth': 1}, 'layout': [('Button.padding', {'sticky': 'nswe', 'children': [('Button.label', {'sticky': 'nswe'})]})]},
             'TEntry': {'configure': {'fieldbackground': 'input_bg', 'foreground': 'primary_text', 'borderwidth': 1, 'padding': 'md', 'insertcolor': 'primary_text'}, 'map': {'bordercolor': [('focus', 'focus_ring'), ('!focus', 'border')], 'lightcolor': [('focus', 'focus_ring')]}},
             'Vertical.TScrollbar': {'configure': {'background': 'scrollbar_thumb', 'troughcolor': 'scrollbar_track', 'arrowcolor': 'secondary_text', 'bordercolor': 'border'}, 'map': {'background': [('active', 'scrollbar_thumb_hover'), ('pressed', 'primary_accent')]}},
@@ -180,20 +206,43 @@ class AdvancedThemeManager(SingletonBase):
                 logger.debug(f"Using base ttk theme: '{theme}'")
                 return
 
+    def _load_lookup_tables(self, config: ThemeConfig) -> None:
+        """Points the variable lookup tables used by _resolve_value at the given theme."""
+        scheme = config.colors
+        self._colors_dict = {name: getattr(scheme, name) for name in _COLOR_FIELD_NAMES}
+        self._spacing = config.spacing
+        self._fonts = config.fonts
+
+    def _resolve_all_styles(self) -> None:
+        """
+        Resolves the style definitions into concrete values once per theme mode.
+        Inheritance, variable lookup and brightness math all happen here, so
+        apply_theme only has to hand finished options to ttk.Style.
+        """
+        for mode, config in self._theme_configs.items():
+            self._load_lookup_tables(config)
+            styles: Dict[str, Dict[str, Any]] = {}
+            for name, definition in self._style_definitions.items():
+                if name.startswith('Tk.'): continue
+                full_def = {**self._style_definitions.get(definition.get('inherit', ''), {}), **definition}
+                resolved: Dict[str, Any] = {}
+                if 'layout' in full_def: resolved['layout'] = full_def['layout']
+                if 'configure' in full_def: resolved['configure'] = self._resolve_style_values(full_def['configure'])
+                if 'map' in full_def:
+                    resolved['map'] = {key: [(state, self._resolve_value(value)) for state, value in states] for key, states in full_def['map'].items()}
+                styles[name] = resolved
+            self._resolved_styles[mode] = styles
+            self._resolved_root_styles[mode] = self._resolve_style_values(self._style_definitions.get('Tk.Root', {}))
+        # Leave the tables on the active mode, not whichever was resolved last.
+        self._load_lookup_tables(self._theme_configs[self._resolved_theme])
+
     def apply_theme(self) -> None:
-        """Applies the entire declarative style dictionary to the ttk.Style object."""
+        """Applies the pre-resolved style dictionary for the current theme to the ttk.Style object."""
         if not self._style or not self._root: return
-        self._color_cache.clear()
-        root_style = self._resolve_style_values(self._style_definitions.get('Tk.Root', {}))
-        self._root.configure(**root_style)
-        for name, definition in self._style_definitions.items():
-            if name.startswith('Tk.'): continue
-            full_def = {**self._style_definitions.get(definition.get('inherit', ''), {}), **definition}
-            if 'layout' in full_def: self._style.layout(name, full_def['layout'])
-            if 'configure' in full_def: self._style.configure(name, **self._resolve_style_values(full_def['configure']))
-            if 'map' in full_def:
-                resolved_map = {key: [(state, self._resolve_value(value)) for state, value in states] for key, states in full_def['map'].items()}
-                self._style.map(name, **resolved_map)
+        self._root.configure(**self._resolved_root_styles[self._resolved_theme])
+        # theme_settings compiles every configure/map/layout into one Tcl script
+        # and evaluates it in a single call, instead of one round-trip per style.
+        self._style.theme_settings(self._style.theme_use(), self._resolved_styles[self._resolved_theme])
 
     def _resolve_style_values(self, style_dict: dict) -> dict:
         """Resolves theme variables (e.g., 'primary_bg') into actual values (e.g., '#1E1E1E')."""
@@ -201,16 +250,15 @@ class AdvancedThemeManager(SingletonBase):
 
     def _resolve_value(self, value: Any) -> Any:
         """Resolves a single theme variable, handling colors, fonts, spacing, and brightness modifiers."""
-        config = self.current_config
         if isinstance(value, str):
-            match = re.match(r"(\w+)(@([+-]?\d*\.?\d+))?$", value)
+            match = _VAR_RE.match(value)
             if match:
                 var_name, _, factor_str = match.groups()
-                if hasattr(config.colors, var_name):
-                    color = getattr(config.colors, var_name)
+                color = self._colors_dict.get(var_name)
+                if color is not None:
                     return self._adjust_color_brightness(color, float(factor_str)) if factor_str else color
-            if value in config.spacing: return config.spacing[value]
-            if value in config.fonts: return config.fonts[value]
+            if value in self._spacing: return self._spacing[value]
+            if value in self._fonts: return self._fonts[value]
         if isinstance(value, (list, tuple)): return [self._resolve_value(v) for v in value]
         return value
 
@@ -224,9 +272,12 @@ class AdvancedThemeManager(SingletonBase):
     def current_config(self) -> ThemeConfig: return self._theme_configs[self._resolved_theme]
     @property
     def colors(self) -> Dict[str, str]:
-        """Returns the current color scheme as a simple dictionary."""
-        scheme = self.current_colors
-        return {field.name: getattr(scheme, field.name) for field in fields(scheme)}
+        """Returns the current color scheme as a simple dictionary (shared; do not mutate)."""
+        colors = self._colors_dict_cache.get(self._resolved_theme)
+        if colors is None:
+            scheme = self.current_colors
+            colors = self._colors_dict_cache[self._resolved_theme] = {name: getattr(scheme, name) for name in _COLOR_FIELD_NAMES}
+        return colors
 
     def set_theme(self, theme: ThemeMode) -> None:
         """Sets the application theme, resolving SYSTEM to LIGHT or DARK."""
@@ -236,9 +287,27 @@ class AdvancedThemeManager(SingletonBase):
         if self._is_initialized and new_resolved_theme == self._resolved_theme: return
         logger.info(f"🎨 Changing theme to: {new_resolved_theme.name} (request was {theme.name})")
         self._resolved_theme = new_resolved_theme
-        self.apply_theme()
+        self._load_lookup_tables(self._theme_configs[new_resolved_theme])
+        # The first apply runs inline so initialize() can fall back on failure;
+        # later switches are coalesced into one pass at the next idle point.
+        if self._is_initialized: self._schedule_apply()
+        else: self.apply_theme()
         self._notify_theme_changed()
 
+    def _schedule_apply(self) -> None:
+        """Queues a single apply_theme for idle time, however many switches arrive first."""
+        if not self._root:
+            self.apply_theme()
+            return
+        if self._apply_pending: return
+        self._apply_pending = True
+        self._root.after_idle(self._do_apply)
+
+    def _do_apply(self) -> None:
+        if not self._apply_pending: return
+        self._apply_pending = False
+        self.apply_theme()
+
     def toggle_theme(self) -> ThemeMode:
         """Toggles between LIGHT and DARK modes."""
         new_theme = ThemeMode.LIGHT if self._resolved_theme == ThemeMode.DARK else ThemeMode.DARK
@@ -251,35 +320,55 @@ class AdvancedThemeManager(SingletonBase):
         try:
             bg_color = self._style.lookup('TFrame', 'background')
             r, g, b = self._root.winfo_rgb(bg_color)
-            brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 65535
-            resolved = ThemeMode.LIGHT if brightness > 0.5 else ThemeMode.DARK
-            logger.debug(f"System theme detected as: {resolved.name} (Brightness: {brightness:.2f})")
+            # Integer Rec. 601 luma on 8-bit channels (weights sum to 256): 0..65280.
+            luma = 77 * (r >> 8) + 150 * (g >> 8) + 29 * (b >> 8)
+            resolved = ThemeMode.LIGHT if luma > 32768 else ThemeMode.DARK
+            logger.debug("System theme detected as: %s (Luma: %d)", resolved.name, luma)
             return resolved
         except Exception as e:
             logger.warning(f"Could not automatically detect system theme: {e}. Defaulting to DARK.")
             return ThemeMode.DARK
 
     def register_theme_listener(self, listener: Callable[[ThemeMode], None]) -> None:
-        self._theme_listeners.add(listener)
+        self._theme_listeners.add(self._listener_entry(listener))
 
     def unregister_theme_listener(self, listener: Callable[[ThemeMode], None]) -> None:
-        self._theme_listeners.discard(listener)
+        self._theme_listeners.discard(self._listener_entry(listener))
+
+    def _listener_entry(self, listener: Callable[[ThemeMode], None]) -> Any:
+        """
+        Weak entry for bound methods, so a listener never keeps its owner alive
+        and drops out of the set once the owner is collected. Plain functions
+        are kept strongly; a weak ref to a lambda would die immediately.
+        """
+        if inspect.ismethod(listener):
+            return weakref.WeakMethod(listener, self._theme_listeners.discard)
+        return listener
 
     def _notify_theme_changed(self) -> None:
-        """Informs all registered listeners that the theme has changed."""
-        for listener in list(self._theme_listeners):
-            try: listener(self._resolved_theme)
+        """Informs all registered listeners that the theme has changed, once Tk is idle."""
+        # Deferred so the restyled widgets repaint before listeners do their own work.
+        if self._root:
+            self._root.after_idle(self._dispatch_listeners, self._resolved_theme)
+        else:
+            self._dispatch_listeners(self._resolved_theme)
+
+    def _dispatch_listeners(self, theme: ThemeMode) -> None:
+        """Invokes every registered listener, isolating failures."""
+        for entry in list(self._theme_listeners):
+            listener = entry() if isinstance(entry, weakref.WeakMethod) else entry
+            if listener is None: continue
+            try: listener(theme)
             except Exception as e: logger.error(f"Error in theme listener {listener}: {e}")
 
     def _adjust_color_brightness(self, color: str, factor: float) -> str:
         """Adjusts a hex color's brightness. Caches results for performance."""
-        cache_key = f"{color}_{factor:.2f}"
-        if cache_key in self._color_cache: return self._color_cache[cache_key]
+        cache_key = (color, factor)
+        cached = self._color_cache.get(cache_key)
+        if cached is not None: return cached
         try:
-            r, g, b = (int(color[i:i+2], 16) for i in (1, 3, 5))
-            if factor > 0: r, g, b = int(r+(255-r)*factor), int(g+(255-g)*factor), int(b+(255-b)*factor)
-            else: r, g, b = int(r*(1+factor)), int(g*(1+factor)), int(b*(1+factor))
-            result = f'#{max(0,min(255,r)):02x}{max(0,min(255,g)):02x}{max(0,min(255,b)):02x}'
+            r, g, b = bytes.fromhex(color[1:7])
+            result = '#%06x' % _adjust_rgb(r, g, b, factor)
             self._color_cache[cache_key] = result
             return result
         except Exception: return color
@@ -11,7 +11,7 @@ package to ensure a clean separation of concerns.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 
 from PIL import Image, ImageTk
 
@@ -27,11 +27,19 @@ logger = get_logger(__name__)
 # ==============================================================================
 class ToolTip:
     """Creates a theme-aware tooltip for a given widget with a configurable delay."""
+
+    # Hidden tooltip windows shared by all instances, reused instead of rebuilt per hover.
+    _pool: List[Tuple[tk.Toplevel, ttk.Label]] = []
+    MAX_POOL_SIZE = 4
+
+    __slots__ = ('widget', 'text', 'delay', 'tooltip_window', '_label', 'show_job_id')
+
     def __init__(self, widget: tk.Widget, text: str, delay: int = 500):
         self.widget = widget
         self.text = text
         self.delay = delay
         self.tooltip_window: Optional[tk.Toplevel] = None
+        self._label: Optional[ttk.Label] = None
         self.show_job_id: Optional[str] = None
 
         self.widget.bind("<Enter>", self.schedule_show, add='+')
@@ -56,17 +64,62 @@ class ToolTip:
             return
         x = self.widget.winfo_pointerx() + 20
         y = self.widget.winfo_pointery() + 10
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        label = ttk.Label(self.tooltip_window, text=self.text, justify='left', style="Tooltip.TLabel")
-        label.pack(ipadx=5, ipady=3)
+        window, label = self._acquire_window()
+        label.configure(text=self.text)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        self.tooltip_window, self._label = window, label
 
     def hide_tooltip(self, event: Any = None) -> None:
-        """Destroys the tooltip window if it exists."""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-        self.tooltip_window = None
+        """Hides the tooltip window and returns it to the shared pool."""
+        window, label = self.tooltip_window, self._label
+        self.tooltip_window = self._label = None
+        if not window:
+            return
+        try:
+            if len(ToolTip._pool) < self.MAX_POOL_SIZE:
+                window.withdraw()
+                ToolTip._pool.append((window, label))
+            else:
+                window.destroy()
+        except tk.TclError:
+            pass  # Window already gone with its root.
+
+    def _acquire_window(self) -> Tuple[tk.Toplevel, ttk.Label]:
+        """Pops a live pooled window, or builds one parented to the root window."""
+        pool = ToolTip._pool
+        while pool:
+            window, label = pool.pop()
+            # Pooled windows die with their root; drop any that no longer exist.
+            # Once the interpreter itself is gone the probe raises instead.
+            try:
+                if window.winfo_exists():
+                    return window, label
+            except tk.TclError:
+                pass
+        # Parent to the root so the window outlives the widget that first showed it.
+        root = self.widget._root()
+        self._hook_root_destroy(root)
+        window = tk.Toplevel(root)
+        window.withdraw()
+        window.wm_overrideredirect(True)
+        label = ttk.Label(window, justify='left', style="Tooltip.TLabel")
+        label.pack(ipadx=5, ipady=3)
+        return window, label
+
+    @staticmethod
+    def _hook_root_destroy(root: tk.Misc) -> None:
+        """Drops a root's pooled windows from the shared pool when that root is destroyed."""
+        if getattr(root, '_tooltip_pool_hooked', False):
+            return
+        root._tooltip_pool_hooked = True
+
+        def on_destroy(event: tk.Event, r=root):
+            # The root's bindtag also fires for every descendant; act on the root only.
+            if event.widget is r:
+                ToolTip._pool[:] = [entry for entry in ToolTip._pool if entry[0]._root() is not r]
+
+        root.bind("<Destroy>", on_destroy, add='+')
 
     def _on_destroy(self, event: Any) -> None:
         """Cleans up bindings when the parent widget is destroyed."""
@@ -78,6 +131,9 @@ class ToolTip:
 # ==============================================================================
 class ClickableLabel(ttk.Label):
     """A label that acts like a hyperlink, with hover effects managed by its style."""
+    # Tk widget bases keep a __dict__; the slot just stores our own attribute directly.
+    __slots__ = ('command',)
+
     def __init__(self, parent, text: str, command: Optional[Callable] = None, **kwargs):
         kwargs.setdefault('style', 'Link.TLabel')
         super().__init__(parent, text=text, cursor="hand2", **kwargs)
@@ -102,6 +158,17 @@ class SearchEntry(ttk.Frame):
         self.placeholder_text = placeholder
         self.debounce_ms = debounce_ms
         self._debounce_job: Optional[str] = None
+        self._epoch = 0  # Bumped per edit; lets one pending job absorb a burst of keystrokes.
+        self._last_fired_value = ""
+        # Pack state of the clear button, tracked here (it is only packed by this class).
+        self._clear_packed = False
+
+        # Placeholder is shown by recoloring the text, not by swapping ttk styles.
+        self.theme = ThemeManager()
+        self._showing_placeholder = False
+        self._load_theme_colors()
+        self.theme.register_theme_listener(self._on_theme_changed)
+        self.bind("<Destroy>", self._on_destroy, add='+')
 
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", self._on_text_change_debounced)
@@ -121,12 +188,28 @@ class SearchEntry(ttk.Frame):
     def _set_placeholder_if_empty(self):
         if not self.search_var.get():
             self.entry.insert(0, self.placeholder_text)
-            self.entry.config(style="Placeholder.TEntry")
+            self.entry.configure(foreground=self._placeholder_fg)
+            self._showing_placeholder = True
 
     def _clear_placeholder(self):
         if self.search_var.get() == self.placeholder_text:
             self.entry.delete(0, "end")
-            self.entry.config(style="Search.TEntry")
+            self.entry.configure(foreground=self._text_fg)
+            self._showing_placeholder = False
+
+    def _load_theme_colors(self):
+        colors = self.theme.colors
+        self._placeholder_fg = colors['secondary_text']
+        self._text_fg = colors['primary_text']
+
+    def _on_theme_changed(self, theme: Any):
+        self._load_theme_colors()
+        if self.winfo_exists():
+            self.entry.configure(foreground=self._placeholder_fg if self._showing_placeholder else self._text_fg)
+
+    def _on_destroy(self, event: Any):
+        if event.widget is self:
+            self.theme.unregister_theme_listener(self._on_theme_changed)
 
     def _on_focus_in(self, event: Any): self._clear_placeholder()
     def _on_focus_out(self, event: Any): self._set_placeholder_if_empty()
@@ -134,26 +217,42 @@ class SearchEntry(ttk.Frame):
     def _on_text_change_debounced(self, *args):
         """Schedules a search after the user stops typing."""
         self._toggle_clear_button()
-        if self._debounce_job: self.after_cancel(self._debounce_job)
-        self._debounce_job = self.after(self.debounce_ms, self._trigger_search_now)
+        self._epoch += 1
+        if self._debounce_job is None:
+            self._debounce_job = self.after(self.debounce_ms, self._consume_epoch, self._epoch)
+
+    def _consume_epoch(self, epoch: int):
+        """Fires the search once edits have settled for a full debounce interval."""
+        if epoch != self._epoch:
+            # Still typing: wait another interval instead of cancel/reschedule per keystroke.
+            self._debounce_job = self.after(self.debounce_ms, self._consume_epoch, self._epoch)
+            return
+        self._debounce_job = None
+        value = self.get_value()
+        if value != self._last_fired_value:
+            self._last_fired_value = value
+            self.on_search(value)
 
     def _trigger_search_now(self):
-        if self._debounce_job:
-            self.after_cancel(self._debounce_job)
-            self._debounce_job = None
-        self.on_search(self.get_value())
+        # Any armed debounce job is left alone: it will see this value as already searched.
+        self._last_fired_value = self.get_value()
+        self.on_search(self._last_fired_value)
 
     def _toggle_clear_button(self):
         show = self.get_value() != ""
-        if show and not self.clear_button.winfo_ismapped():
+        if show is self._clear_packed:
+            return
+        if show:
             self.clear_button.pack(side="right", padx=(5, 5))
-        elif not show and self.clear_button.winfo_ismapped():
+        else:
             self.clear_button.pack_forget()
+        self._clear_packed = show
 
     def _clear_search(self, event: Any = None):
         self.search_var.set("")
         self._set_placeholder_if_empty()
         self.entry.focus_set()
+        self._last_fired_value = ""
         self.on_clear()
 
     def focus_search(self):
@@ -177,7 +276,8 @@ class StatusBar(ttk.Frame):
         self.message_label = ttk.Label(self, textvariable=self.message_var, anchor="w")
         self.message_label.pack(side="left", fill="x", expand=True)
         self.progress_bar = ttk.Progressbar(self, orient="horizontal", length=150, mode="determinate")
-        self.show_progress(False)
+        # Pack state of the progress bar; only show_progress may pack/forget it.
+        self._progress_packed = False
 
     def set_message(self, message: str, level: str = "info"):
         self.message_var.set(message)
@@ -185,10 +285,14 @@ class StatusBar(ttk.Frame):
         self.message_label.config(style=style_map.get(level, "Status.TLabel"))
 
     def show_progress(self, show: bool = True):
-        if show and not self.progress_bar.winfo_ismapped():
+        show = bool(show)
+        if show is self._progress_packed:
+            return
+        if show:
             self.progress_bar.pack(side="right", padx=(10, 0))
-        elif not show and self.progress_bar.winfo_ismapped():
+        else:
             self.progress_bar.pack_forget()
+        self._progress_packed = show
 
     def update_progress(self, value: float, message: Optional[str] = None):
         self.progress_bar['value'] = value
@@ -199,6 +303,12 @@ class StatusBar(ttk.Frame):
 # ==============================================================================
 class ThumbnailLabel(ttk.Label):
     """A label for displaying track thumbnails with a themed placeholder."""
+
+    # One placeholder image per background color, shared by every instance.
+    _placeholder_cache: Dict[str, ImageTk.PhotoImage] = {}
+
+    __slots__ = ('theme', 'photo')
+
     def __init__(self, parent, theme_manager: ThemeManager, **kwargs):
         super().__init__(parent, style="Thumbnail.TLabel", **kwargs)
         self.theme = theme_manager
@@ -209,8 +319,11 @@ class ThumbnailLabel(ttk.Label):
         """Creates a default placeholder image based on the current theme."""
         try:
             placeholder_color = self.theme.current_colors.tertiary_bg
-            img = Image.new('RGB', THUMBNAIL_SIZE, color=placeholder_color)
-            self.photo = ImageTk.PhotoImage(img)
+            photo = ThumbnailLabel._placeholder_cache.get(placeholder_color)
+            if photo is None:
+                img = Image.new('RGB', THUMBNAIL_SIZE, color=placeholder_color)
+                photo = ThumbnailLabel._placeholder_cache[placeholder_color] = ImageTk.PhotoImage(img)
+            self.photo = photo
             self.config(image=self.photo)
         except Exception as e:
             logger.error(f"Failed to create placeholder image: {e}")
@@ -229,11 +342,17 @@ class ThumbnailLabel(ttk.Label):
 # ==============================================================================
 class ProgressDialog(tk.Toplevel):
     """A modal dialog to show progress for long-running, non-UI tasks."""
+
+    # Nominal size of the fixed layout below: 300px content + 20px padding per side,
+    # message line + progress bar + their pady.
+    DIALOG_SIZE = (340, 120)
+
     def __init__(self, parent, title: str = "Working..."):
         super().__init__(parent)
         self.parent = parent
         self.title(title)
         self.transient(parent)
+        self._center_on_parent()
         self.grab_set()
         self.resizable(False, False)
         self.protocol("WM_DELETE_WINDOW", lambda: None)
@@ -245,16 +364,14 @@ class ProgressDialog(tk.Toplevel):
         main_frame.pack(fill="both", expand=True)
         ttk.Label(main_frame, textvariable=self.message_var, wraplength=300).pack(pady=(0, 10))
         ttk.Progressbar(main_frame, orient="horizontal", length=300, mode="determinate", variable=self.progress_var).pack(pady=10)
-        self.after(50, self._center_window)
 
-    def _center_window(self):
-        self.update_idletasks()
-        parent_x, parent_y = self.parent.winfo_x(), self.parent.winfo_y()
-        parent_w, parent_h = self.parent.winfo_width(), self.parent.winfo_height()
-        dialog_w, dialog_h = self.winfo_width(), self.winfo_height()
-        x = parent_x + (parent_w - dialog_w) // 2
-        y = parent_y + (parent_h - dialog_h) // 2
-        self.geometry(f"+{x}+{y}")
+    def _center_on_parent(self):
+        """Positions the dialog over the parent from its known size, without a layout pass."""
+        dialog_w, dialog_h = self.DIALOG_SIZE
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() - dialog_w) // 2
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() - dialog_h) // 2
+        # Position only: the window still sizes to its content if the message wraps.
+        self.geometry(f"+{max(0, x)}+{max(0, y)}")
 
     def update_progress(self, value: float, message: str):
         self.progress_var.set(max(0, min(100, value)))
@@ -2,7 +2,9 @@
 Professional Window Builder for Udio Media Manager
 """
 
+import functools
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk
 from typing import Optional
 
@@ -12,6 +14,22 @@ from .themes import ThemeManager
 
 logger = get_logger(__name__)
 
+# Icon locations tried in order, relative to the working directory.
+_ICON_CANDIDATES = (
+    Path("assets/icon.ico"),
+    Path("assets/icon.png"),
+    Path("../assets/icon.ico"),
+    Path("../../assets/icon.png"),
+    Path("../../../assets/icon.ico"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_icon_path() -> Optional[Path]:
+    """Returns the first existing icon candidate; probed once per process."""
+    return next((p for p in _ICON_CANDIDATES if p.exists()), None)
+
+
 class WindowBuilder:
     """Professional window builder with theme integration"""
     
@@ -78,22 +96,11 @@ class WindowBuilder:
     def _set_window_icon(self) -> None:
         """Set window icon if available"""
         try:
-            from pathlib import Path
-            
-            # Try different icon paths
-            icon_paths = [
-                Path("assets/icon.ico"),
-                Path("assets/icon.png"),
-                Path("../assets/icon.ico"),
-                Path("../../assets/icon.png"),
-                Path("../../../assets/icon.ico")
-            ]
-            
-            for icon_path in icon_paths:
-                if icon_path.exists():
-                    self.root.iconbitmap(str(icon_path))
-                    logger.debug(f"Window icon set: {icon_path}")
-                    return
+            icon_path = _find_icon_path()
+            if icon_path:
+                self.root.iconbitmap(str(icon_path))
+                logger.debug(f"Window icon set: {icon_path}")
+                return
                     
             logger.debug("No window icon found, using default")
             
@@ -103,9 +110,9 @@ class WindowBuilder:
     def _center_window(self) -> None:
         """Center the window on screen"""
         try:
-            self.root.update_idletasks()
-            width = self.root.winfo_width()
-            height = self.root.winfo_height()
+            # The size is the one we just requested, so no layout pass
+            # (update_idletasks) is needed to measure it.
+            width, height = DEFAULT_WINDOW_SIZE
             x = (self.root.winfo_screenwidth() // 2) - (width // 2)
             y = (self.root.winfo_screenheight() // 2) - (height // 2)
             self.root.geometry(f'{width}x{height}+{x}+{y}')
@@ -1,59 +1,70 @@
 """
 Utility functions and helpers for Udio Media Manager.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+e.g. ``utils.logging`` does not also load file_utils, validation and helpers.
 """
 
-from .logging import LogManager, get_logger, setup_logging, LoggingContext
-from .file_utils import FileUtils, PathValidator, FileOrganizer
-from .validation import (
-    TrackValidator, 
-    FileValidator, 
-    DataSanitizer, 
-    ValidationResult
-)
-from .helpers import (
-    Timer,
-    retry,
-    singleton,
-    Throttler,
-    format_duration,
-    format_file_size,
-    safe_get,
-    temporary_chdir,
-    Cache,
-    get_resource_path,
-    is_main_thread,
-    run_in_main_thread
-)
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .logging import LogManager, get_logger, setup_logging, LoggingContext
+    from .file_utils import FileUtils, PathValidator, FileOrganizer
+    from .validation import TrackValidator, TrackError, FileValidator, DataSanitizer, ValidationResult
+    from .helpers import (
+        Timer, retry, singleton, Throttler, format_duration, format_file_size, safe_get,
+        temporary_chdir, resolve_against, Cache, get_resource_path, is_main_thread, run_in_main_thread
+    )
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
     # Logging
-    'LogManager',
-    'get_logger', 
-    'setup_logging',
-    'LoggingContext',
+    'LogManager': 'logging',
+    'get_logger': 'logging',
+    'setup_logging': 'logging',
+    'LoggingContext': 'logging',
     
     # File Utilities
-    'FileUtils',
-    'PathValidator',
-    'FileOrganizer',
+    'FileUtils': 'file_utils',
+    'PathValidator': 'file_utils',
+    'FileOrganizer': 'file_utils',
     
     # Validation
-    'TrackValidator',
-    'FileValidator',
-    'DataSanitizer', 
-    'ValidationResult',
+    'TrackValidator': 'validation',
+    'TrackError': 'validation',
+    'FileValidator': 'validation',
+    'DataSanitizer': 'validation',
+    'ValidationResult': 'validation',
     
     # General Helpers
-    'Timer',
-    'retry',
-    'singleton',
-    'Throttler',
-    'format_duration',
-    'format_file_size', 
-    'safe_get',
-    'temporary_chdir',
-    'Cache',
-    'get_resource_path',
-    'is_main_thread',
-    'run_in_main_thread',
-]
\ No newline at end of file
+    'Timer': 'helpers',
+    'retry': 'helpers',
+    'singleton': 'helpers',
+    'Throttler': 'helpers',
+    'format_duration': 'helpers',
+    'format_file_size': 'helpers',
+    'safe_get': 'helpers',
+    'temporary_chdir': 'helpers',
+    'resolve_against': 'helpers',
+    'Cache': 'helpers',
+    'get_resource_path': 'helpers',
+    'is_main_thread': 'helpers',
+    'run_in_main_thread': 'helpers',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,17 @@
 General helper utilities for Udio Media Manager.
 """
 
+import os
 import time
+import heapq
+import asyncio
+import inspect
 import functools
 import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from pathlib import Path
 
 from ..utils.logging import get_logger
@@ -18,6 +23,8 @@ logger = get_logger(__name__)
 T = TypeVar('T')
 R = TypeVar('R')
 
+_MISSING = object()
+
 
 class Timer:
     """
@@ -32,13 +39,13 @@ class Timer:
         
     def __enter__(self):
         self.start_time = time.time()
-        self.logger.debug(f"Starting: {self.name}")
+        self.logger.debug("Starting: %s", self.name)
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.end_time = time.time()
         duration = self.end_time - self.start_time
-        self.logger.debug(f"Completed: {self.name} in {duration:.3f}s")
+        self.logger.debug("Completed: %s in %.3fs", self.name, duration)
         
     @property
     def duration(self) -> float:
@@ -54,45 +61,62 @@ def retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
-    logger_instance = None
+    logger_instance = None,
+    max_backoff: float = 60.0
 ):
     """
     Decorator for retrying function calls with exponential backoff.
     
+    Works on both plain functions and coroutine functions; coroutines wait
+    with asyncio.sleep so retries don't block the event loop.
+    
     Args:
-        max_attempts: Maximum number of attempts
+        max_attempts: Maximum number of attempts, including the first call
         delay: Initial delay between attempts in seconds
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch and retry on
         logger_instance: Logger to use for messages
+        max_backoff: Upper bound for the delay between attempts in seconds
     """
     log = logger_instance or logger
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        def on_failure(attempt: int, error: Exception, current_delay: float) -> float:
+            """Logs a failed attempt and returns the delay to use after the next one."""
+            if attempt == max_attempts:
+                log.error("Function %s failed after %d attempts: %s", func.__name__, max_attempts, error)
+                raise error
+            log.warning(
+                "Attempt %d/%d failed for %s: %s. Retrying in %.1fs...",
+                attempt, max_attempts, func.__name__, error, current_delay
+            )
+            return min(current_delay * backoff, max_backoff)
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                current_delay = min(delay, max_backoff)
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        next_delay = on_failure(attempt, e, current_delay)
+                    await asyncio.sleep(current_delay)
+                    current_delay = next_delay
+                    
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            current_delay = delay
-            last_exception = None
-            
+            current_delay = min(delay, max_backoff)
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        log.error(f"Function {func.__name__} failed after {max_attempts} attempts: {e}")
-                        raise
-                    
-                    log.warning(
-                        f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
-                        f"Retrying in {current_delay:.1f}s..."
-                    )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-                    
-            # This should never be reached, but for type safety
-            raise last_exception  # type: ignore
-            
+                    next_delay = on_failure(attempt, e, current_delay)
+                time.sleep(current_delay)
+                current_delay = next_delay
+                
         return wrapper
     return decorator
 
@@ -107,13 +131,18 @@ def singleton(cls: T) -> T:
     Returns:
         Singleton class instance
     """
-    instances = {}
+    instance = _MISSING
+    lock = threading.Lock()
     
     @functools.wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        # Double-checked: after construction this is a single identity test.
+        if instance is _MISSING:
+            with lock:
+                if instance is _MISSING:
+                    instance = cls(*args, **kwargs)
+        return instance
         
     return get_instance  # type: ignore
 
@@ -121,27 +150,34 @@ def singleton(cls: T) -> T:
 class Throttler:
     """
     Rate limiter for function calls.
+    
+    Each call reserves the next free time slot under a short lock and then
+    sleeps outside it, so waiting callers don't hold up others from
+    reserving their own slots.
     """
     
     def __init__(self, calls_per_second: float = 1.0):
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_call_time = 0.0
+        self._interval_ns = int(1_000_000_000 / calls_per_second)
+        # Monotonic time at which the next call may run.
+        self._next_slot_ns = 0
         self._lock = threading.Lock()
         
+    def _reserve(self) -> int:
+        """Claims the next call slot; returns nanoseconds to wait for it."""
+        with self._lock:
+            now = time.monotonic_ns()
+            slot = max(now, self._next_slot_ns)
+            self._next_slot_ns = slot + self._interval_ns
+        return slot - now
+        
     def __call__(self, func: Callable[..., R]) -> Callable[..., R]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> R:
-            with self._lock:
-                current_time = time.time()
-                time_since_last_call = current_time - self.last_call_time
-                
-                if time_since_last_call < self.min_interval:
-                    sleep_time = self.min_interval - time_since_last_call
-                    time.sleep(sleep_time)
-                    
-                self.last_call_time = time.time()
-                
+            wait_ns = self._reserve()
+            if wait_ns > 0:
+                time.sleep(wait_ns / 1_000_000_000)
             return func(*args, **kwargs)
         return wrapper
 
@@ -159,8 +195,13 @@ def format_duration(seconds: float) -> str:
     if not seconds or seconds < 0:
         return "--:--"
         
-    minutes = int(seconds // 60)
-    seconds_remaining = int(seconds % 60)
+    # Only whole seconds are shown, so bucket to int for the cache to hit.
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    minutes, seconds_remaining = divmod(seconds, 60)
     
     if minutes < 60:
         return f"{minutes:02d}:{seconds_remaining:02d}"
@@ -170,6 +211,7 @@ def format_duration(seconds: float) -> str:
         return f"{hours}:{minutes_remaining:02d}:{seconds_remaining:02d}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in bytes to human-readable string.
@@ -207,46 +249,107 @@ def safe_get(dictionary: Dict[Any, Any], keys: Union[str, List[str]], default: A
     Returns:
         Value if found, default otherwise
     """
+    # Single key: one lookup, no list to build or loop over.
     if isinstance(keys, str):
-        keys = [keys]
+        return dictionary.get(keys, default) if isinstance(dictionary, dict) else default
         
     current = dictionary
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
             
     return current
 
 
+# The working directory is process-wide; temporary_chdir holds this for its
+# whole block. Reentrant so a thread may nest temporary_chdir calls.
+_CHDIR_LOCK = threading.RLock()
+
+
+def resolve_against(path: Union[str, Path], base: Path) -> Path:
+    """
+    Resolve a path relative to base without touching the working directory.
+    
+    Prefer this to temporary_chdir: it is thread-safe and serializes nothing.
+    
+    Args:
+        path: Relative (or absolute) path
+        base: Directory that relative paths are interpreted against
+        
+    Returns:
+        Absolute, resolved Path
+    """
+    return (base / path).resolve()
+
+
 @contextmanager
 def temporary_chdir(path: Path):
     """
     Context manager for temporarily changing working directory.
     
+    The working directory is shared by all threads, so concurrent uses are
+    serialized on a module lock. Where possible pass explicit base paths
+    instead (see resolve_against).
+    
     Args:
         path: Directory to change to
     """
-    import os
-    
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(path)
-        yield
-    finally:
-        os.chdir(original_cwd)
+    with _CHDIR_LOCK:
+        if hasattr(os, 'fchdir'):
+            # Restore through a descriptor: works even if the original
+            # directory is renamed or its path removed in the meantime.
+            original_fd = os.open('.', os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            try:
+                os.chdir(path)
+                try:
+                    yield
+                finally:
+                    os.fchdir(original_fd)
+            finally:
+                os.close(original_fd)
+        else:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(path)
+                yield
+            finally:
+                os.chdir(original_cwd)
 
 
 class Cache:
     """
     Simple in-memory cache with TTL support.
+    
+    Keys are spread over independently locked shards, so threads working
+    on unrelated keys don't contend on a single lock. Memory is bounded:
+    once a shard holds its share of max_entries, inserting evicts that
+    shard's least recently used entry.
+    
+    Each shard keeps values and expiry times in two parallel dicts, so no
+    (value, expire_time) tuple is allocated per entry, plus a min-heap of
+    (expire_time, key) so cleanup only touches entries that have actually
+    expired. Overwritten, deleted and evicted keys leave stale heap items
+    behind; they are skipped when popped, and the heap is rebuilt if they
+    come to dominate it.
     """
     
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default
-        self._cache: Dict[str, tuple] = {}
+    SHARD_COUNT = 16  # Must be a power of two
+    
+    def __init__(self, default_ttl: int = 300, max_entries: int = 10_000):  # 5 minutes default
+        # Per shard: (values in LRU order, expire times, expiry heap, lock)
+        self._shards: List[Tuple[OrderedDict, Dict[str, float], List[Tuple[float, str]], threading.Lock]] = [
+            (OrderedDict(), {}, [], threading.Lock()) for _ in range(self.SHARD_COUNT)
+        ]
+        self._shard_mask = self.SHARD_COUNT - 1
+        self._shard_capacity = max(1, -(-max_entries // self.SHARD_COUNT))
         self.default_ttl = default_ttl
-        self._lock = threading.RLock()
+        self.max_entries = max_entries
+        
+    def _shard(self, key: str) -> Tuple[OrderedDict, Dict[str, float], List[Tuple[float, str]], threading.Lock]:
+        return self._shards[hash(key) & self._shard_mask]
         
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -257,9 +360,21 @@ class Cache:
             value: Value to cache
             ttl: Time to live in seconds
         """
-        with self._lock:
-            expire_time = time.time() + (ttl or self.default_ttl)
-            self._cache[key] = (value, expire_time)
+        values, expires, heap, lock = self._shard(key)
+        expire_time = time.time() + (ttl or self.default_ttl)
+        with lock:
+            values[key] = value
+            values.move_to_end(key)
+            expires[key] = expire_time
+            if len(values) > self._shard_capacity:
+                evicted, _ = values.popitem(last=False)
+                del expires[evicted]
+                
+            heapq.heappush(heap, (expire_time, key))
+            if len(heap) > 2 * len(expires) + 64:
+                # Mostly stale items; rebuild from the live entries.
+                heap[:] = [(expire, k) for k, expire in expires.items()]
+                heapq.heapify(heap)
             
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -272,16 +387,19 @@ class Cache:
         Returns:
             Cached value or default
         """
-        with self._lock:
-            if key not in self._cache:
+        values, expires, _, lock = self._shard(key)
+        with lock:
+            expire_time = expires.get(key)
+            if expire_time is None:
                 return default
                 
-            value, expire_time = self._cache[key]
             if time.time() > expire_time:
-                del self._cache[key]
+                del values[key]
+                del expires[key]
                 return default
                 
-            return value
+            values.move_to_end(key)
+            return values[key]
             
     def delete(self, key: str) -> bool:
         """
@@ -293,16 +411,20 @@ class Cache:
         Returns:
             True if key was deleted, False if not found
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        values, expires, _, lock = self._shard(key)
+        with lock:
+            if expires.pop(key, None) is None:
+                return False
+            del values[key]
+            return True
             
     def clear(self) -> None:
         """Clear all cached values."""
-        with self._lock:
-            self._cache.clear()
+        for values, expires, heap, lock in self._shards:
+            with lock:
+                values.clear()
+                expires.clear()
+                heap.clear()
             
     def cleanup_expired(self) -> int:
         """
@@ -311,19 +433,27 @@ class Cache:
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, (_, expire_time) in self._cache.items()
-                if current_time > expire_time
-            ]
+        removed = 0
+        current_time = time.time()
+        # One shard locked at a time, so lookups elsewhere keep going.
+        for values, expires, heap, lock in self._shards:
+            with lock:
+                while heap and heap[0][0] < current_time:
+                    expire_time, key = heapq.heappop(heap)
+                    # Skip stale items left by overwrites, deletes and evictions
+                    if expires.get(key) == expire_time:
+                        del values[key]
+                        del expires[key]
+                        removed += 1
             
-            for key in expired_keys:
-                del self._cache[key]
-                
-            return len(expired_keys)
+        return removed
+
+
+# Fixed for the life of the process, so computed once.
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 
+@functools.lru_cache(maxsize=256)
 def get_resource_path(relative_path: str) -> Path:
     """
     Get absolute path to resource file.
@@ -334,8 +464,7 @@ def get_resource_path(relative_path: str) -> Path:
     Returns:
         Absolute Path object
     """
-    project_root = Path(__file__).parent.parent.parent
-    return project_root / relative_path
+    return _PROJECT_ROOT / relative_path
 
 
 def is_main_thread() -> bool:
@@ -365,6 +494,6 @@ def run_in_main_thread(func: Callable[..., R]) -> Callable[..., R]:
         else:
             # This would need to be implemented with the specific UI framework
             # For now, just log a warning
-            logger.warning(f"Function {func.__name__} should be called from main thread")
+            logger.warning("Function %s should be called from main thread", func.__name__)
             return func(*args, **kwargs)
     return wrapper
\ No newline at end of file
@@ -7,27 +7,66 @@ This module provides intelligent logging that suppresses repetitive success mess
 and only shows important information after the first few instances.
 """
 
+import re
 import logging
+import itertools
 import logging.handlers
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List, Set
 from collections import defaultdict
 
 from ..core.singleton import SingletonBase
 from ..core.exceptions import ConfigurationError
 
 
+# Substrings that mark an INFO record as a routine success message.
+SUCCESS_PATTERNS = (
+    "✅", "Successfully", "completed successfully", "loaded successfully",
+    "parsed successfully", "built successfully", "initialized successfully",
+    "retrieved", "displaying", "found", "added", "created"
+)
+
+# All patterns in one alternation, so each record is scanned once in C.
+_SUCCESS_RE = re.compile('|'.join(map(re.escape, SUCCESS_PATTERNS)))
+
+
 class QuietFilter(logging.Filter):
     """
     Filter that suppresses repetitive success messages after a threshold.
     """
     
-    def __init__(self, name: str = "", success_threshold: int = 5):
+    def __init__(
+        self,
+        name: str = "",
+        success_threshold: int = 5,
+        auto_quiet_after: Optional[int] = None,
+        on_noisy_module: Optional[Callable[[str], None]] = None
+    ):
         super().__init__(name)
         self.success_threshold = success_threshold
+        # Once a module has this many suppressed messages, on_noisy_module is
+        # called with its name (once) so it can be silenced at the logger.
+        self.auto_quiet_after = auto_quiet_after
+        self.on_noisy_module = on_noisy_module
         self.success_counts = defaultdict(int)
         self.suppressed_messages = defaultdict(int)
+        # Modules past the threshold; their successes are dropped without counting.
+        self._suppressing: Set[str] = set()
+        
+    def _is_success(self, record: logging.LogRecord) -> bool:
+        """
+        Checks the unformatted template first: a pattern in the template is
+        also in the message, so args only get %-formatted when it misses.
+        """
+        msg = record.msg
+        if isinstance(msg, str):
+            if _SUCCESS_RE.search(msg):
+                return True
+            if not record.args:
+                # Already-formatted message (e.g. an f-string): nothing left to check.
+                return False
+        return _SUCCESS_RE.search(record.getMessage()) is not None
         
     def filter(self, record: logging.LogRecord) -> bool:
         # Always show warnings and errors
@@ -35,54 +74,61 @@ class QuietFilter(logging.Filter):
             return True
             
         # For INFO messages, check if they're repetitive successes
-        if record.levelno == logging.INFO:
-            message = record.getMessage()
-            
-            # Check if this is a success message (common patterns)
-            is_success = any(pattern in message for pattern in [
-                "✅", "Successfully", "completed successfully", "loaded successfully",
-                "parsed successfully", "built successfully", "initialized successfully",
-                "retrieved", "displaying", "found", "added", "created"
-            ])
-            
-            if is_success:
-                # Use module name as key to track per-module success counts
-                module_key = record.name
+        if record.levelno == logging.INFO and self._is_success(record):
+            # Use module name as key to track per-module success counts
+            module_key = record.name
+            if module_key not in self._suppressing:
                 self.success_counts[module_key] += 1
                 
                 # Only show first few successes per module
-                if self.success_counts[module_key] > self.success_threshold:
-                    self.suppressed_messages[module_key] += 1
-                    return False
+                if self.success_counts[module_key] <= self.success_threshold:
+                    return True
+                self._suppressing.add(module_key)
+                
+            suppressed = self.suppressed_messages[module_key] = self.suppressed_messages[module_key] + 1
+            if suppressed == self.auto_quiet_after and self.on_noisy_module is not None:
+                self.on_noisy_module(module_key)
+            return False
                     
         # Show everything else
         return True
+        
+    def reset(self) -> None:
+        """Forgets all success and suppression counts."""
+        self.success_counts.clear()
+        self.suppressed_messages.clear()
+        self._suppressing.clear()
 
 
 class ProgressTracker:
     """
     Tracks progress and only logs at milestones to reduce spam.
+    
+    Safe to share between worker threads: the count comes from an
+    itertools.count, whose next() is a single atomic C call under the GIL.
+    With concurrent callers ``current`` is the last value stored and may
+    trail increments still in flight.
     """
     
     def __init__(self, total: int, milestone_interval: int = 100):
         self.total = total
         self.current = 0
-        self.milestone_interval = milestone_interval
+        self._counter = itertools.count(1)
+        # Rounded up to a power of two so milestones are a mask test, not a modulo.
+        self.milestone_interval = 1 << max(0, milestone_interval - 1).bit_length()
+        self._mask = self.milestone_interval - 1
         self.last_milestone = 0
         
     def increment(self) -> bool:
         """
         Increment counter and return True if should log progress.
         """
-        self.current += 1
-        should_log = (
-            self.current >= self.total or
-            self.current % self.milestone_interval == 0 or
-            self.current - self.last_milestone >= self.milestone_interval
-        )
+        # Decide on the value this call produced, not the shared attribute.
+        current = self.current = next(self._counter)
+        should_log = current >= self.total or not (current & self._mask)
         
         if should_log:
-            self.last_milestone = self.current
+            self.last_milestone = current
             
         return should_log
         
@@ -99,7 +145,6 @@ class LogManager(SingletonBase):
     def __init__(self):
         super().__init__()
         self._configured = False
-        self._loggers: Dict[str, logging.Logger] = {}
         self._spam_filters: List[str] = []
         self._quiet_filter: Optional[QuietFilter] = None
         
@@ -113,10 +158,16 @@ class LogManager(SingletonBase):
         log_format: Optional[str] = None,
         enable_spam_filters: bool = True,
         enable_quiet_mode: bool = True,
-        success_threshold: int = 3  # Show only first 3 successes per module
+        success_threshold: int = 3,  # Show only first 3 successes per module
+        auto_quiet_after: Optional[int] = None
     ) -> None:
         """
         Configure quiet logging that suppresses repetitive success messages.
+        
+        auto_quiet_after, if set, raises a module's logger to WARNING once
+        that many of its messages were suppressed, so its INFO records are
+        dropped before reaching any handler. Off by default: it also keeps
+        those records out of the log file.
         """
         with self._instance_lock:
             if self._configured:
@@ -145,9 +196,15 @@ class LogManager(SingletonBase):
             console_handler.setLevel(console_level)
             console_handler.setFormatter(formatter)
             
-            # Add quiet filter to suppress repetitive successes
-            if enable_quiet_mode:
-                self._quiet_filter = QuietFilter(success_threshold=success_threshold)
+            # Add quiet filter to suppress repetitive successes. It only acts on
+            # INFO records, so skip it when the console never sees those. The
+            # handler's level is compared because console_level may be a name.
+            if enable_quiet_mode and console_handler.level <= logging.INFO:
+                self._quiet_filter = QuietFilter(
+                    success_threshold=success_threshold,
+                    auto_quiet_after=auto_quiet_after,
+                    on_noisy_module=self.quiet_module
+                )
                 console_handler.addFilter(self._quiet_filter)
             
             root_logger.addHandler(console_handler)
@@ -189,24 +246,28 @@ class LogManager(SingletonBase):
         ]
         
         for spam_source in spam_sources:
-            spam_logger = logging.getLogger(spam_source)
-            spam_logger.setLevel(logging.WARNING)
-            self._spam_filters.append(spam_source)
+            self.quiet_module(spam_source)
+            
+    def quiet_module(self, name: str, level: int = logging.WARNING) -> None:
+        """
+        Raise a module logger's level so records below it are discarded by
+        Logger.isEnabledFor, before any handler or filter runs.
+        """
+        logging.getLogger(name).setLevel(level)
+        if name not in self._spam_filters:
+            self._spam_filters.append(name)
             
     def get_logger(self, name: str, level: Optional[int] = None) -> logging.Logger:
         """
         Get a logger with optional level override.
+        
+        logging.getLogger already caches loggers under its own lock, so no
+        registry or lock of our own is needed here.
         """
-        with self._instance_lock:
-            if name not in self._loggers:
-                logger = logging.getLogger(name)
-                
-                if level is not None:
-                    logger.setLevel(level)
-                    
-                self._loggers[name] = logger
-                
-            return self._loggers[name]
+        logger = logging.getLogger(name)
+        if level is not None:
+            logger.setLevel(level)
+        return logger
             
     def get_suppression_stats(self) -> Dict[str, int]:
         """
@@ -221,8 +282,7 @@ class LogManager(SingletonBase):
         Reset suppression counts (useful after major operations).
         """
         if self._quiet_filter:
-            self._quiet_filter.success_counts.clear()
-            self._quiet_filter.suppressed_messages.clear()
+            self._quiet_filter.reset()
                 
     def shutdown(self):
         """Clean shutdown with suppression summary."""
@@ -231,10 +291,9 @@ class LogManager(SingletonBase):
             if self._quiet_filter and self._quiet_filter.suppressed_messages:
                 total_suppressed = sum(self._quiet_filter.suppressed_messages.values())
                 logger = self.get_logger("LogManager")
-                logger.info(f"📊 Suppressed {total_suppressed} repetitive success messages")
+                logger.info("📊 Suppressed %d repetitive success messages", total_suppressed)
                 
             logging.shutdown()
-            self._loggers.clear()
             super().shutdown()
 
 
@@ -276,31 +335,33 @@ class BatchLogger:
         self.logger = logger
         self.operation_name = operation_name
         self.total_items = total_items
-        self.processed = 0
         self.errors = 0
         self.progress_tracker = ProgressTracker(total_items, milestone_interval=50)
         
+    @property
+    def processed(self) -> int:
+        """Number of successes logged so far."""
+        return self.progress_tracker.current
+        
     def log_success(self, item_name: str = ""):
         """Log success, but only at milestones."""
-        self.processed += 1
-        if self.progress_tracker.increment():
-            progress = self.progress_tracker.get_progress()
-            self.logger.info(f"📦 {self.operation_name}: {progress}")
+        if self.progress_tracker.increment() and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("📦 %s: %s", self.operation_name, self.progress_tracker.get_progress())
             
     def log_error(self, item_name: str, error: str):
         """Always log errors."""
         self.errors += 1
-        self.logger.error(f"❌ {self.operation_name} failed for {item_name}: {error}")
+        self.logger.error("❌ %s failed for %s: %s", self.operation_name, item_name, error)
         
     def complete(self):
         """Log completion summary."""
         if self.errors > 0:
             self.logger.warning(
-                f"⚠️  {self.operation_name} completed with {self.errors} errors "
-                f"({self.processed} successful)"
+                "⚠️  %s completed with %d errors (%d successful)",
+                self.operation_name, self.errors, self.processed
             )
         else:
-            self.logger.info(f"✅ {self.operation_name} completed successfully")
+            self.logger.info("✅ %s completed successfully", self.operation_name)
 
 
 # Convenience functions
@@ -2,20 +2,125 @@
 Data validation utilities for Udio Media Manager.
 """
 
+import os
 import re
+import json
+import math
+import stat
 from datetime import datetime
+from enum import IntFlag, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..core.exceptions import TrackValidationError
 from ..domain.models import Track
-from ..domain.enums import FileType
 from ..utils.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# Characters invalid in filenames on most file systems, mapped to '_'.
+# str.translate replaces them in one C pass, no regex engine involved.
+_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*' + ''.join(map(chr, range(32))), '_'))
+
+# Compiled once; the sanitizers run per field for every track.
+_INT_RE = re.compile(r'\d+')
+_FLOAT_RE = re.compile(r'\d+\.?\d*')
+
+# String spellings accepted by DataSanitizer.sanitize_boolean.
+_TRUE_STRINGS = frozenset(('true', 'yes', '1', 'on', 'finished', 'publishable'))
+_FALSE_STRINGS = frozenset(('false', 'no', '0', 'off', 'disliked'))
+
+# Fields TrackValidator.validate_metadata requires to be present and truthy.
+# A tuple rather than a set so errors are reported in a stable order.
+_REQUIRED_METADATA_FIELDS = ('title', 'artist')
+
+# (field, expected type) pairs checked by TrackValidator.validate_metadata.
+_METADATA_TYPE_CHECKS = (
+    ('title', str),
+    ('artist', str),
+    ('duration', (int, float)),
+    ('plays', int),
+    ('likes', int),
+    ('finished', bool),
+    ('publishable', bool),
+    ('disliked', bool),
+)
+
+
+class TrackError(IntFlag):
+    """Individual checks failed by TrackValidator.check_track."""
+    MISSING_SONG_ID = auto()
+    INVALID_SONG_ID = auto()
+    MISSING_BASE_NAME = auto()
+    MISSING_TXT = auto()
+    MISSING_MP3 = auto()
+    MISSING_MP4 = auto()
+    MISSING_AVIF = auto()
+    MISSING_LRC = auto()
+    MISSING_TITLE = auto()
+    MISSING_ARTIST = auto()
+    NEGATIVE_DURATION = auto()
+    NEGATIVE_PLAYS = auto()
+    NEGATIVE_LIKES = auto()
+    NEGATIVE_FILE_SIZE = auto()
+    FUTURE_CREATED = auto()
+    INVALID_CREATED = auto()
+    INVALID_TAG = auto()
+    INVALID_LYRIC_TIMESTAMP = auto()
+    INVALID_LYRIC_LINE = auto()
+
+
+# Message per flag, in reporting order; formatted with the track only on demand.
+_TRACK_ERROR_MESSAGES: Dict[TrackError, str] = {
+    TrackError.MISSING_SONG_ID: "Song ID is required",
+    TrackError.INVALID_SONG_ID: "Invalid Song ID format: {track.song_id}",
+    TrackError.MISSING_BASE_NAME: "Base name is required",
+    TrackError.MISSING_TXT: "Metadata file (.txt) is required and must exist",
+    TrackError.MISSING_MP3: "MP3 file does not exist: {track.mp3}",
+    TrackError.MISSING_MP4: "MP4 file does not exist: {track.mp4}",
+    TrackError.MISSING_AVIF: "AVIF file does not exist: {track.avif}",
+    TrackError.MISSING_LRC: "LRC file does not exist: {track.lrc}",
+    TrackError.MISSING_TITLE: "Title is required and cannot be 'Untitled'",
+    TrackError.MISSING_ARTIST: "Artist is required and cannot be 'Unknown'",
+    TrackError.NEGATIVE_DURATION: "Duration cannot be negative",
+    TrackError.NEGATIVE_PLAYS: "Plays cannot be negative",
+    TrackError.NEGATIVE_LIKES: "Likes cannot be negative",
+    TrackError.NEGATIVE_FILE_SIZE: "File size cannot be negative",
+    TrackError.FUTURE_CREATED: "Creation date cannot be in the future",
+    TrackError.INVALID_CREATED: "Invalid creation date format",
+    TrackError.INVALID_TAG: "Tags must be non-empty strings",
+    TrackError.INVALID_LYRIC_TIMESTAMP: "Lyric timestamps must be non-negative numbers",
+    TrackError.INVALID_LYRIC_LINE: "Lyric lines must be strings",
+}
+
+# Optional per-track file attributes whose paths must exist when set.
+_FILE_ATTRS = (
+    ('mp3', TrackError.MISSING_MP3),
+    ('mp4', TrackError.MISSING_MP4),
+    ('avif', TrackError.MISSING_AVIF),
+    ('lrc', TrackError.MISSING_LRC),
+)
+
+
+def _path_exists(path_value: Union[str, Path], stat_cache: Optional[Dict[str, Optional[os.stat_result]]]) -> bool:
+    """
+    os.stat-based existence check that records results in stat_cache
+    (None for missing paths), so a path shared by several checks or tracks
+    is stat'ed once. Callers that already walked the directory with
+    os.scandir can pre-fill the cache from DirEntry.stat().
+    """
+    key = os.fspath(path_value)
+    if stat_cache is not None and key in stat_cache:
+        return stat_cache[key] is not None
+    try:
+        result = os.stat(key)
+    except (OSError, ValueError):
+        result = None
+    if stat_cache is not None:
+        stat_cache[key] = result
+    return result is not None
+
 
 class TrackValidator:
     """
@@ -26,82 +131,147 @@ class TrackValidator:
     UUID_PATTERN = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$', re.IGNORECASE)
     
     @staticmethod
-    def validate_track(track: Track) -> List[str]:
+    def check_track(
+        track: Track,
+        stat_cache: Optional[Dict[str, Optional[os.stat_result]]] = None,
+        now: Optional[datetime] = None
+    ) -> TrackError:
         """
-        Validate a Track object for completeness and data integrity.
+        Validate a Track object, returning the failed checks as flags.
+        
+        No message strings are built, so callers that only need to know
+        whether a track is valid can test the result for truthiness.
         
         Args:
             track: Track object to validate
+            stat_cache: Optional path -> stat result (None if missing) map,
+                shared across calls to avoid re-stat'ing the same files
+            now: Reference time for the future-date check (defaults to now)
             
         Returns:
-            List of validation error messages (empty if valid)
+            TrackError flags (empty if valid)
         """
-        errors = []
+        errors = TrackError(0)
         
         # Validate required fields
         if not track.song_id:
-            errors.append("Song ID is required")
+            errors |= TrackError.MISSING_SONG_ID
         elif not TrackValidator.is_valid_uuid(track.song_id):
-            errors.append(f"Invalid Song ID format: {track.song_id}")
+            errors |= TrackError.INVALID_SONG_ID
             
         if not track.base_name:
-            errors.append("Base name is required")
+            errors |= TrackError.MISSING_BASE_NAME
             
-        if not track.txt or not Path(track.txt).exists():
-            errors.append("Metadata file (.txt) is required and must exist")
+        if not track.txt or not _path_exists(track.txt, stat_cache):
+            errors |= TrackError.MISSING_TXT
             
         # Validate file paths
-        for file_type in [FileType.MP3, FileType.MP4, FileType.AVIF, FileType.LRC]:
-            path_attr = file_type.value
-            path_value = getattr(track, path_attr)
-            
-            if path_value and not Path(path_value).exists():
-                errors.append(f"{file_type.value.upper()} file does not exist: {path_value}")
+        for attr, flag in _FILE_ATTRS:
+            path_value = getattr(track, attr)
+            if path_value and not _path_exists(path_value, stat_cache):
+                errors |= flag
                 
         # Validate metadata fields
         if not track.title or track.title.strip() == "Untitled":
-            errors.append("Title is required and cannot be 'Untitled'")
+            errors |= TrackError.MISSING_TITLE
             
         if not track.artist or track.artist.strip() == "Unknown":
-            errors.append("Artist is required and cannot be 'Unknown'")
+            errors |= TrackError.MISSING_ARTIST
             
         # Validate numeric fields
         if track.duration < 0:
-            errors.append("Duration cannot be negative")
+            errors |= TrackError.NEGATIVE_DURATION
             
         if track.plays < 0:
-            errors.append("Plays cannot be negative")
+            errors |= TrackError.NEGATIVE_PLAYS
             
         if track.likes < 0:
-            errors.append("Likes cannot be negative")
+            errors |= TrackError.NEGATIVE_LIKES
             
         if track.file_size < 0:
-            errors.append("File size cannot be negative")
+            errors |= TrackError.NEGATIVE_FILE_SIZE
             
         # Validate date fields
         if track.created:
             try:
-                if track.created > datetime.now():
-                    errors.append("Creation date cannot be in the future")
+                if track.created > (now or datetime.now()):
+                    errors |= TrackError.FUTURE_CREATED
             except (TypeError, ValueError):
-                errors.append("Invalid creation date format")
+                errors |= TrackError.INVALID_CREATED
                 
         # Validate tags
-        if track.tags:
-            for tag in track.tags:
-                if not isinstance(tag, str) or not tag.strip():
-                    errors.append("Tags must be non-empty strings")
-                    
+        if track.tags and not all(isinstance(tag, str) and tag.strip() for tag in track.tags):
+            errors |= TrackError.INVALID_TAG
+            
         # Validate lyrics structure
         if track.lyrics:
-            for timestamp, line in track.lyrics:
-                if not isinstance(timestamp, (int, float)) or timestamp < 0:
-                    errors.append("Lyric timestamps must be non-negative numbers")
-                if not isinstance(line, str):
-                    errors.append("Lyric lines must be strings")
-                    
+            if any(not isinstance(timestamp, (int, float)) or timestamp < 0 for timestamp, _ in track.lyrics):
+                errors |= TrackError.INVALID_LYRIC_TIMESTAMP
+            if any(not isinstance(line, str) for _, line in track.lyrics):
+                errors |= TrackError.INVALID_LYRIC_LINE
+                
         return errors
         
+    @staticmethod
+    def error_messages(errors: TrackError, track: Track) -> List[str]:
+        """
+        Format the messages for a check_track result.
+        
+        Args:
+            errors: Flags returned by check_track
+            track: The track that was checked (its fields fill the messages)
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        if not errors:
+            return []
+        return [
+            message.format(track=track)
+            for flag, message in _TRACK_ERROR_MESSAGES.items()
+            if flag in errors
+        ]
+        
+    @staticmethod
+    def validate_track(
+        track: Track,
+        stat_cache: Optional[Dict[str, Optional[os.stat_result]]] = None,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Validate a Track object for completeness and data integrity.
+        
+        Args:
+            track: Track object to validate
+            stat_cache: Optional path -> stat result (None if missing) map,
+                shared across calls to avoid re-stat'ing the same files
+            now: Reference time for the future-date check (defaults to now)
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        return TrackValidator.error_messages(TrackValidator.check_track(track, stat_cache, now), track)
+        
+    @staticmethod
+    def validate_batch(tracks: List[Track]) -> List[List[str]]:
+        """
+        Validate many tracks, e.g. when revalidating a whole library.
+        
+        Shares one stat cache and one reference time across all tracks, so
+        files referenced by several tracks are stat'ed once and the clock is
+        read once.
+        
+        Args:
+            tracks: Track objects to validate
+            
+        Returns:
+            One list of validation errors per track, in input order
+        """
+        stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        now = datetime.now()
+        validate = TrackValidator.validate_track
+        return [validate(track, stat_cache, now) for track in tracks]
+        
     @staticmethod
     def is_valid_uuid(uuid_string: str) -> bool:
         """
@@ -111,12 +281,19 @@ class TrackValidator:
             uuid_string: String to validate
             
         Returns:
-            True if valid UUID format
+            True if valid UUID format (canonical hyphenated form)
         """
+        # Fixed-layout check, no regex or UUID object: 36 chars, hyphens at
+        # 8/13/18/23, and 32 hex digits in between.
+        if not isinstance(uuid_string, str) or len(uuid_string) != 36:
+            return False
+        s = uuid_string
+        if s[8] != '-' or s[13] != '-' or s[18] != '-' or s[23] != '-':
+            return False
         try:
-            UUID(uuid_string)
-            return True
-        except (ValueError, AttributeError):
+            # fromhex skips whitespace, so also require all 16 bytes.
+            return len(bytes.fromhex(s[:8] + s[9:13] + s[14:18] + s[19:23] + s[24:])) == 16
+        except ValueError:
             return False
             
     @staticmethod
@@ -133,39 +310,29 @@ class TrackValidator:
         errors = []
         
         # Check required fields
-        required_fields = ['title', 'artist']
-        for field in required_fields:
-            if field not in metadata or not metadata[field]:
+        for field in _REQUIRED_METADATA_FIELDS:
+            if not metadata.get(field):
                 errors.append(f"Required field missing: {field}")
                 
         # Validate field types
-        type_checks = [
-            ('title', str),
-            ('artist', str),
-            ('duration', (int, float)),
-            ('plays', int),
-            ('likes', int),
-            ('finished', bool),
-            ('publishable', bool),
-            ('disliked', bool),
-        ]
-        
-        for field, expected_type in type_checks:
-            if field in metadata and metadata[field] is not None:
-                if not isinstance(metadata[field], expected_type):
-                    errors.append(f"Field '{field}' has invalid type: {type(metadata[field])}")
+        for field, expected_type in _METADATA_TYPE_CHECKS:
+            value = metadata.get(field)
+            # The identity test settles exact-type values without isinstance.
+            if value is not None and type(value) is not expected_type and not isinstance(value, expected_type):
+                errors.append(f"Field '{field}' has invalid type: {type(value)}")
                     
         # Validate date field if present
-        if 'created' in metadata and metadata['created']:
-            if not isinstance(metadata['created'], datetime):
-                errors.append("Field 'created' must be a datetime object")
+        created = metadata.get('created')
+        if created and not isinstance(created, datetime):
+            errors.append("Field 'created' must be a datetime object")
                 
         # Validate tags if present
-        if 'tags' in metadata and metadata['tags']:
-            if not isinstance(metadata['tags'], list):
+        tags = metadata.get('tags')
+        if tags:
+            if not isinstance(tags, list):
                 errors.append("Field 'tags' must be a list")
             else:
-                for tag in metadata['tags']:
+                for tag in tags:
                     if not isinstance(tag, str):
                         errors.append("All tags must be strings")
                         
@@ -193,20 +360,25 @@ class FileValidator:
             if not file_path:
                 return False, "Path cannot be empty"
                 
-            if must_exist and not file_path.exists():
+            if not must_exist:
+                return True, None
+                
+            # One stat answers existence, type and size
+            try:
+                st = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return False, f"File does not exist: {file_path}"
                 
-            if must_exist and not file_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return False, f"Path is not a file: {file_path}"
                 
             # Check file size (basic sanity check)
-            if must_exist:
-                file_size = file_path.stat().st_size
-                if file_size == 0:
-                    return False, f"File is empty: {file_path}"
-                if file_size > 100 * 1024 * 1024:  # 100MB
-                    return False, f"File too large: {file_size / (1024*1024):.1f}MB"
-                    
+            file_size = st.st_size
+            if file_size == 0:
+                return False, f"File is empty: {file_path}"
+            if file_size > 100 * 1024 * 1024:  # 100MB
+                return False, f"File too large: {file_size / (1024*1024):.1f}MB"
+                
             return True, None
             
         except (OSError, PermissionError) as e:
@@ -228,19 +400,23 @@ class FileValidator:
             if not directory_path:
                 return False, "Path cannot be empty"
                 
-            if must_exist and not directory_path.exists():
+            if not must_exist:
+                return True, None
+                
+            try:
+                st = os.stat(directory_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return False, f"Directory does not exist: {directory_path}"
                 
-            if must_exist and not directory_path.is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, f"Path is not a directory: {directory_path}"
                 
-            # Test basic read access
-            if must_exist:
-                try:
-                    next(directory_path.iterdir(), None)
-                except PermissionError:
-                    return False, f"No read permission for directory: {directory_path}"
-                    
+            # Test basic read access; opening the handle is enough, no entry is read
+            try:
+                os.scandir(directory_path).close()
+            except PermissionError:
+                return False, f"No read permission for directory: {directory_path}"
+                
             return True, None
             
         except (OSError, PermissionError) as e:
@@ -264,6 +440,11 @@ class DataSanitizer:
         Returns:
             Sanitized string
         """
+        # Fast path for the common case; strip() hands back the same object
+        # when there is nothing to remove, so clean strings cost no allocation.
+        if type(value) is str:
+            return value.strip() or default
+            
         if value is None:
             return default
             
@@ -289,15 +470,20 @@ class DataSanitizer:
             return default
             
         try:
-            if isinstance(value, (int, float)):
+            if type(value) is str:
+                # Well-formed numbers parse in C without touching the regex
+                try:
+                    return int(value)
+                except ValueError:
+                    pass
+                # Extract the first number from string
+                match = _INT_RE.search(value)
+                return int(match.group()) if match else default
+            elif isinstance(value, (int, float)):
                 return int(value)
-            elif isinstance(value, str):
-                # Extract numbers from string
-                numbers = re.findall(r'\d+', value)
-                return int(numbers[0]) if numbers else default
             else:
                 return default
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return default
             
     @staticmethod
@@ -316,12 +502,20 @@ class DataSanitizer:
             return default
             
         try:
-            if isinstance(value, (int, float)):
+            if type(value) is str:
+                # Well-formed numbers parse in C without touching the regex;
+                # "nan"/"inf" spellings still go through the extraction below
+                try:
+                    result = float(value)
+                    if math.isfinite(result):
+                        return result
+                except ValueError:
+                    pass
+                # Extract the first number from string
+                match = _FLOAT_RE.search(value)
+                return float(match.group()) if match else default
+            elif isinstance(value, (int, float)):
                 return float(value)
-            elif isinstance(value, str):
-                # Extract numbers from string
-                numbers = re.findall(r'\d+\.?\d*', value)
-                return float(numbers[0]) if numbers else default
             else:
                 return default
         except (ValueError, TypeError):
@@ -342,21 +536,21 @@ class DataSanitizer:
         if value is None:
             return default
             
-        if isinstance(value, bool):
-            return value
-        elif isinstance(value, (int, float)):
-            return bool(value)
-        elif isinstance(value, str):
-            true_values = ['true', 'yes', '1', 'on', 'finished', 'publishable']
-            false_values = ['false', 'no', '0', 'off', 'disliked']
-            
+        # Exact type tests cover the common cases without an isinstance MRO
+        # walk; subclasses (e.g. IntEnum) fall through to the isinstance path.
+        value_type = type(value)
+        if value_type is str or isinstance(value, str):
             value_lower = value.lower().strip()
-            if value_lower in true_values:
+            if value_lower in _TRUE_STRINGS:
                 return True
-            elif value_lower in false_values:
+            elif value_lower in _FALSE_STRINGS:
                 return False
             else:
                 return default
+        elif value_type is bool:
+            return value
+        elif value_type is int or value_type is float or isinstance(value, (int, float)):
+            return bool(value)
         else:
             return default
             
@@ -376,27 +570,28 @@ class DataSanitizer:
             
         try:
             if isinstance(tags, str):
-                # Try to parse as JSON first
-                try:
-                    import json
-                    parsed = json.loads(tags)
-                    if isinstance(parsed, list):
-                        tags = parsed
-                    else:
-                        # Split by commas
-                        tags = [tag.strip() for tag in tags.split(',')]
-                except (json.JSONDecodeError, TypeError):
+                # Only a JSON array is used as-is, and those start with '[';
+                # anything else skips the parse (and its exception).
+                parsed = None
+                if tags.lstrip()[:1] == '[':
+                    try:
+                        parsed = json.loads(tags)
+                    except ValueError:
+                        pass
+                        
+                if isinstance(parsed, list):
+                    tags = parsed
+                else:
                     # Split by commas
                     tags = [tag.strip() for tag in tags.split(',')]
                     
             if isinstance(tags, list):
-                sanitized = []
-                for tag in tags:
-                    if tag and isinstance(tag, str):
-                        sanitized_tag = tag.strip()
-                        if sanitized_tag:
-                            sanitized.append(sanitized_tag)
-                return sanitized
+                # One comprehension: its loop variables are locals, with no
+                # per-tag append() method lookups.
+                return [
+                    stripped for tag in tags
+                    if tag and isinstance(tag, str) and (stripped := tag.strip())
+                ]
             else:
                 return []
                 
@@ -414,12 +609,8 @@ class DataSanitizer:
         Returns:
             Normalized filename
         """
-        import re
-        import os
-        
         # Remove invalid characters for most file systems
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        normalized = re.sub(invalid_chars, '_', filename)
+        normalized = filename.translate(_FILENAME_TABLE)
         
         # Remove leading/trailing spaces and dots
         normalized = normalized.strip('. ')
@@ -441,28 +632,48 @@ class ValidationResult:
     Container for validation results with detailed error information.
     """
     
+    # Slots and lazily created lists: most results pass, so they never
+    # allocate the instance dict or the two lists.
+    __slots__ = ('is_valid', '_errors', '_warnings')
+    
     def __init__(self):
         self.is_valid = True
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self._errors: Optional[List[str]] = None
+        self._warnings: Optional[List[str]] = None
+        
+    @property
+    def errors(self) -> Sequence[str]:
+        """Validation errors, in the order they were added."""
+        return self._errors if self._errors is not None else ()
+        
+    @property
+    def warnings(self) -> Sequence[str]:
+        """Validation warnings, in the order they were added."""
+        return self._warnings if self._warnings is not None else ()
         
     def add_error(self, error: str):
         """Add a validation error."""
         self.is_valid = False
-        self.errors.append(error)
+        if self._errors is None:
+            self._errors = [error]
+        else:
+            self._errors.append(error)
         
     def add_warning(self, warning: str):
         """Add a validation warning."""
-        self.warnings.append(warning)
+        if self._warnings is None:
+            self._warnings = [warning]
+        else:
+            self._warnings.append(warning)
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             'is_valid': self.is_valid,
-            'errors': self.errors,
-            'warnings': self.warnings,
-            'has_errors': bool(self.errors),
-            'has_warnings': bool(self.warnings),
+            'errors': list(self.errors),
+            'warnings': list(self.warnings),
+            'has_errors': self._errors is not None,
+            'has_warnings': self._warnings is not None,
         }
         
     def __bool__(self):